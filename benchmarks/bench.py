@@ -0,0 +1,242 @@
+"""Benchmark suite for the simulators and analytic routines in revenue_core.
+
+    python benchmarks/bench.py                          # run everything, print a table
+    python benchmarks/bench.py -k grid --quick          # subset, smaller sizes
+    python benchmarks/bench.py --save baseline.json     # store results as a JSON baseline
+    python benchmarks/bench.py --compare baseline.json  # compare against a baseline
+
+Each case is timed best-of-``--repeat`` with enough inner loops to run for
+at least ``--min-time`` seconds; peak memory is the tracemalloc peak of one
+extra call (NumPy reports its buffers to tracemalloc). Throughput is
+simulated nights per second for simulators and evaluated policies per second
+for the exact routines.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import revenue_core as rc  # noqa: E402
+
+# Base scenario of Slides 3.x
+BASE = dict(C=100, r_L=80, r_H=200, c_bump=400, mean_H=50, std_H=15, noshow_rate=0.10)
+
+
+def _policy_grid(n_Q, n_Y):
+    return np.arange(n_Q) * (100 // max(n_Q, 1)), np.arange(n_Y)
+
+
+def cases(quick=False):
+    """Yield (name, params, fn, units, unit_name); fn() runs the case once."""
+    scale = (1_000, 10_000) if quick else (1_000, 10_000, 100_000, 1_000_000)
+
+    # Slide simulators: scaling over n_simulations
+    for n in scale:
+        yield "simulate_fcfs", {"n": n}, lambda n=n: rc.simulate_fcfs(n), n, "nights"
+        yield "simulate_exact_booking", {"n": n}, lambda n=n: rc.simulate_exact_booking(n), n, "nights"
+
+    # Original scalar-loop simulator (bypassing the cache)
+    legacy = rc.simulate_combined_policy.__wrapped__
+    for n in (1_000,) if quick else (1_000, 5_000):
+        yield (
+            "simulate_combined_policy", {"n": n},
+            lambda n=n: legacy(**BASE, Q=40, Y=10, n_simulations=n), n, "nights",
+        )
+
+    # Vectorized engine: n_simulations, grid size and capacity
+    for n in scale[:3]:
+        yield (
+            "simulate_combined_policy_grid", {"n": n, "grid": "1x1"},
+            lambda n=n: rc.simulate_combined_policy_grid(**BASE, Q=40, Y=10, n_simulations=n), n, "nights",
+        )
+    for n_Q, n_Y in ((10, 10), (50, 30)) if quick else ((10, 10), (50, 30), (100, 30)):
+        Q, Y = _policy_grid(n_Q, n_Y)
+        yield (
+            "simulate_combined_policy_grid", {"n": 5_000, "grid": f"{n_Q}x{n_Y}"},
+            lambda Q=Q, Y=Y: rc.simulate_combined_policy_grid(**BASE, Q=Q, Y=Y, n_simulations=5_000),
+            5_000 * n_Q * n_Y, "nights",
+        )
+    for C in (100, 400) if quick else (100, 400, 1_600):
+        params = {**BASE, "C": C, "mean_H": C / 2, "std_H": 0.15 * C}
+        yield (
+            "simulate_combined_policy_grid", {"n": 5_000, "C": C, "crn": True},
+            lambda p=params: rc.simulate_combined_policy_grid(
+                **p, Q=int(0.4 * p["C"]), Y=int(0.1 * p["C"]), n_simulations=5_000, crn=True
+            ),
+            5_000, "nights",
+        )
+
+    # Four-policy comparison, bypassing the cache
+    compare = rc.run_policy_comparison.__wrapped__
+    yield "run_policy_comparison", {"method": "exact"}, lambda: compare(**BASE), 4, "policies"
+    yield (
+        "run_policy_comparison", {"method": "simulate", "crn": True, "n": 5_000},
+        lambda: compare(**BASE, method="simulate", crn=True), 4 * 5_000, "nights",
+    )
+    if not quick:
+        yield (
+            "run_policy_comparison", {"method": "simulate", "n": 5_000},
+            lambda: compare(**BASE, method="simulate"), 4 * 5_000, "nights",
+        )
+
+    # Exact routines: capacity and grid size
+    for C in (100, 400) if quick else (100, 400, 1_600):
+        yield (
+            "evaluate_combined_policy", {"C": C, "grid": "1x1"},
+            lambda C=C: rc.evaluate_combined_policy(
+                **{**BASE, "C": C, "mean_H": C / 2, "std_H": 0.15 * C}, Q=int(0.4 * C), Y=int(0.1 * C)
+            ),
+            1, "policies",
+        )
+        yield (
+            "compute_metrics", {"C": C},
+            lambda C=C: rc.compute_metrics(C, 80, 200, C / 2, 0.15 * C, Q=int(0.4 * C)), 1, "policies",
+        )
+        yield (
+            "compute_metrics_curve", {"C": C},
+            lambda C=C: rc.compute_metrics_curve(C, 80, 200, C / 2, 0.15 * C), C + 1, "policies",
+        )
+        yield (
+            "compute_overbooking_metrics", {"C": C},
+            lambda C=C: rc.compute_overbooking_metrics(C, 150, 400, 0.10, Y=int(0.1 * C)), 1, "policies",
+        )
+        yield (
+            "compute_overbooking_curve", {"C": C},
+            lambda C=C: rc.compute_overbooking_curve(C, 150, 400, 0.10, np.arange(int(0.3 * C) + 1)),
+            int(0.3 * C) + 1, "policies",
+        )
+    Q, Y = _policy_grid(100, 30)
+    yield (
+        "evaluate_combined_policy", {"C": 100, "grid": "100x30"},
+        lambda: rc.evaluate_combined_policy(**BASE, Q=Q, Y=Y), 100 * 30, "policies",
+    )
+
+    # Nested protection levels: one year of arrival dates with 12 fare classes
+    rng = np.random.default_rng(0)
+    fares = np.sort(rng.uniform(50, 500, (365, 12)), axis=-1)[:, ::-1]
+    mean = rng.uniform(5, 30, (365, 12))
+    yield "emsr_a", {"nights": 365, "k": 12}, lambda: rc.emsr_a(fares, mean, 0.3 * mean), 365, "nights"
+    yield "emsr_b", {"nights": 365, "k": 12}, lambda: rc.emsr_b(fares, mean, 0.3 * mean), 365, "nights"
+    protection = rc.emsr_b(fares, mean, 0.3 * mean)
+    yield (
+        "simulate_nested_booking", {"nights": 365, "k": 12, "n": 1_000},
+        lambda: rc.simulate_nested_booking(200, fares, mean, 0.3 * mean, protection, n_simulations=1_000),
+        365 * 1_000, "nights",
+    )
+
+    # Backward induction: capacity and horizon length
+    for C, T in ((100, 200), (1_000, 500)) if quick else ((100, 200), (1_000, 500), (5_000, 500)):
+        probs = rng.dirichlet(np.ones(13), T)[:, :12] * 0.9
+        yield (
+            "dp_booking_control", {"C": C, "periods": T, "k": 12},
+            lambda C=C, probs=probs: rc.dp_booking_control(C, fares[0], probs), C * T, "states",
+        )
+
+
+def measure(fn, repeat=5, min_time=0.2):
+    """Best seconds per call over ``repeat`` rounds, and the peak traced memory of one call."""
+    fn()  # warm up scipy imports and caches
+    loops, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def case_id(name, params):
+    return name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="keyword", help="only run cases whose id contains this substring")
+    parser.add_argument("--quick", action="store_true", help="smaller problem sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--save", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare against a JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="with --compare, exit 1 if any case is this many times slower (default 1.25)",
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else {}
+    results = {}
+    header = f"{'case':<72} {'time/call':>11} {'throughput':>18} {'peak mem':>10}"
+    print(header + ("  vs baseline" if baseline else ""))
+    print("-" * (len(header) + (13 if baseline else 0)))
+    regressions = []
+    for name, params, fn, units, unit_name in cases(quick=args.quick):
+        cid = case_id(name, params)
+        if args.keyword and args.keyword not in cid:
+            continue
+        seconds, peak = measure(fn, repeat=args.repeat, min_time=args.min_time)
+        results[cid] = {
+            "seconds": seconds,
+            "throughput": units / seconds,
+            "unit": f"{unit_name}/s",
+            "peak_bytes": peak,
+        }
+        line = f"{cid:<72} {seconds * 1e3:9.3f}ms {units / seconds:12.3g} {unit_name + '/s':<5} {peak / 2**20:8.2f}MB"
+        if cid in baseline:
+            ratio = seconds / baseline[cid]["seconds"]
+            line += f"  {ratio:5.2f}x time"
+            if ratio > args.threshold:
+                regressions.append(cid)
+        print(line)
+
+    if args.save:
+        args.save.write_text(json.dumps({"environment": environment(), "results": results}, indent=2) + "\n")
+        print(f"Saved {len(results)} results to {args.save}")
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than {args.threshold}x baseline:", file=sys.stderr)
+        for cid in regressions:
+            print(f"  {cid}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Startup-time report and regression check for revenue.py.
+
+    python benchmarks/startup.py            # import-time breakdown and time to first slide
+    python benchmarks/startup.py --check    # exit 1 if startup regressed
+
+Every measurement runs in a fresh interpreter so module caches do not leak
+between runs. Import times come from ``python -X importtime``. "Time to first
+slide" runs the notebook with ``app.run()`` and reads when the title slide
+cell finished from the notebook's profiler (REVENUE_PROFILE=1).
+
+The budget is relative: the title slide may take at most ``--max-ratio``
+times the cold import of marimo and numpy, which it cannot avoid, measured
+on the same machine in the same run.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ("marimo", "numpy", "polars", "altair", "scipy.stats", "revenue_core")
+
+# Libraries the title slide must not pull in with lazy imports
+HEAVY_MODULES = ("altair", "polars", "scipy.stats", "pandas")
+
+# What every start pays before the first slide, the reference for the budget
+BASELINE_MODULES = ("marimo", "numpy")
+
+FIRST_SLIDE_SNIPPET = """
+import json, sys, time
+start = time.time()
+
+# First time each heavy module is seen in sys.modules, checked on every import
+loaded = {}
+def audit(event, args):
+    if event == "import":
+        for name in HEAVY:
+            if name not in loaded and name in sys.modules:
+                loaded[name] = time.time()
+sys.addaudithook(audit)
+
+from revenue import app
+
+_, defs = app.run()
+shown = next(r["timestamp"] for r in defs["profiler"].records if r["cell"] == "Title slide")
+print(json.dumps({"seconds": shown - start, "loaded": [m for m, t in loaded.items() if t <= shown],
+                  "import_times": defs["import_times"]}))
+"""
+
+
+def _run(args, env=None):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times(*names):
+    """Cumulative cold import time of each module, from ``python -X importtime``."""
+    stderr = _run(["-X", "importtime", "-c", f"import {', '.join(names)}"]).stderr
+    # Lines read "import time: self [us] | cumulative | imported package"
+    times = {}
+    for line in stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() in names:
+            times[fields[2].strip()] = int(fields[1]) / 1e6
+    return times
+
+
+def import_breakdown():
+    """Cold import time of each library on its own (shared dependencies counted in each)."""
+    times = {}
+    for name in MODULES:
+        try:
+            times[name] = import_times(name)[name]
+        except subprocess.CalledProcessError:
+            times[name] = None
+    return times
+
+
+def baseline_seconds(repeat=3):
+    """Best-of-``repeat`` cold import of BASELINE_MODULES in one interpreter."""
+    return min(sum(import_times(*BASELINE_MODULES).values()) for _ in range(repeat))
+
+
+def time_to_first_slide(eager=False, repeat=3):
+    """Best-of-``repeat`` cold time until the title slide has rendered."""
+    env = {"REVENUE_EAGER_IMPORTS": "1" if eager else "0", "REVENUE_PROFILE": "1"}
+    code = f"HEAVY = {HEAVY_MODULES!r}\n" + FIRST_SLIDE_SNIPPET
+    runs = [json.loads(_run(["-c", code], env).stdout.strip().splitlines()[-1]) for _ in range(repeat)]
+    return min(runs, key=lambda r: r["seconds"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail on a startup regression")
+    parser.add_argument(
+        "--max-ratio", type=float, default=3.0,
+        help="max time to first slide as a multiple of the marimo + numpy import (default 3.0)",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    try:
+        report = {
+            "import_seconds": import_breakdown(),
+            "baseline_seconds": baseline_seconds(),
+            "first_slide_lazy": time_to_first_slide(eager=False),
+            "first_slide_eager": time_to_first_slide(eager=True),
+        }
+    except subprocess.CalledProcessError as error:
+        # A notebook that does not run at all is a failed check, not a crash of the script
+        last_line = (error.stderr or "").strip().splitlines()[-1:] or [f"exit status {error.returncode}"]
+        print(f"FAIL: notebook did not start: {last_line[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("Cold import time per library:")
+        for name, seconds in report["import_seconds"].items():
+            print(f"  {name:<14} {'not installed' if seconds is None else f'{seconds * 1000:8.1f} ms'}")
+        print(f"Baseline ({' + '.join(BASELINE_MODULES)} import): {report['baseline_seconds'] * 1000:.0f} ms")
+        for mode in ("lazy", "eager"):
+            run = report[f"first_slide_{mode}"]
+            loaded = ", ".join(run["loaded"]) or "none"
+            print(f"Time to first slide ({mode}): {run['seconds'] * 1000:.0f} ms, heavy modules loaded: {loaded}")
+            for name, seconds in run["import_times"].items():
+                print(f"  {name:<14} {seconds * 1000:8.1f} ms recorded by the notebook")
+
+    if args.check:
+        lazy = report["first_slide_lazy"]
+        failures = []
+        if lazy["loaded"]:
+            failures.append(f"title slide imports {', '.join(lazy['loaded'])}")
+        ratio = lazy["seconds"] / report["baseline_seconds"]
+        if ratio > args.max_ratio:
+            failures.append(
+                f"time to first slide {lazy['seconds']:.2f}s is {ratio:.1f}x the baseline, "
+                f"budget {args.max_ratio:.1f}x"
+            )
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
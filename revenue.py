@@ -11,50 +11,261 @@ app = marimo.App(
 @app.cell
 async def _():
     # Only install packages in WebAssembly environment
-    try:
-        import micropip
-
-        # Install required packages
-        packages = [
-            "marimo",
-            "polars",
-            "altair",
-            "numpy",
-            "pyarrow",
-            "scipy",
-        ]
-
-        for pkg in packages:
-            print(f"Installing {pkg}...")
-            await micropip.install(pkg)
+    async def bootstrap(packages, lock_path):
+        """Install the missing packages in one micropip transaction and report the time.
 
-        print("All packages installed.")
-    except ImportError:
-        # Running locally, packages should already be installed
-        print("Running in local mode, skipping micropip installation")
+        Packages from the Pyodide distribution keep its versions; the rest are
+        pinned to uv.lock when it can be fetched.
+        """
+        try:
+            import micropip
+        except ImportError:
+            # Running locally, packages should already be installed
+            print("Running in local mode, skipping micropip installation")
+            return
+
+        import importlib.util
+        import json
+        import time
+        import tomllib
+
+        import marimo
+        from pyodide.http import pyfetch
+
+        start = time.perf_counter()
+        # micropip.freeze() is a pyodide-lock.json: the distribution's packages by name
+        provided = json.loads(micropip.freeze())["packages"]
+        pins = {}
+        try:
+            response = await pyfetch(str(marimo.notebook_location() / lock_path))
+            if response.ok:
+                lock = tomllib.loads(await response.string())
+                pins = {p["name"]: p["version"] for p in lock.get("package", [])}
+        except Exception as error:
+            print(f"Could not read {lock_path} ({error}), installing unpinned")
+        print(f"uv.lock fetched in {time.perf_counter() - start:.2f}s ({len(pins)} pins)")
+
+        missing = [name for name in packages if importlib.util.find_spec(name) is None]
+        if not missing:
+            return
+        sources, requirements = {}, []
+        for name in missing:
+            if name in provided:
+                sources[name] = f"Pyodide {provided[name]['version']}"
+                requirements.append(name)
+            elif name in pins:
+                sources[name] = f"PyPI =={pins[name]} (uv.lock)"
+                requirements.append(f"{name}=={pins[name]}")
+            else:
+                sources[name] = "PyPI, unpinned"
+                requirements.append(name)
+
+        # One transaction, so shared dependencies (numpy, ...) are resolved once
+        start = time.perf_counter()
+        try:
+            await micropip.install(requirements)
+        except Exception as error:
+            # E.g. a pin without a pure-Python or wasm wheel: let micropip pick
+            print(f"Pinned install failed ({error}), retrying unpinned")
+            sources = {name: "PyPI, unpinned" if "PyPI" in source else source for name, source in sources.items()}
+            try:
+                await micropip.install(missing)
+            except Exception as error:
+                print(f"Install failed ({error}), the notebook cannot run without {', '.join(missing)}")
+                return
+        print(f"Installed {len(missing)} packages in {time.perf_counter() - start:.2f}s:")
+        for name in missing:
+            print(f"  {name:<10} {sources[name]}")
+
+    # The deploy workflow copies uv.lock into public/
+    await bootstrap(["marimo", "polars", "altair", "numpy", "pyarrow", "scipy"], "public/uv.lock")
     return
 
 
 @app.cell(hide_code=True)
 def _():
     # Import required libraries
-    import marimo as mo
-    import altair as alt
-    import polars as pl
-    import numpy as np
-    from scipy import stats
+    import importlib
+    import os
+    import sys
+    import time
+    import types
     import warnings
 
+    # Seconds spent importing each library, filled in as they load. A library
+    # something else loaded first (marimo by its own runtime, scipy.stats by
+    # revenue_core) cost the notebook nothing and is not listed
+    import_times = {}
+
+    def timed_import(name):
+        if name in sys.modules:
+            return sys.modules[name]
+        # Includes any parent packages not loaded yet, e.g. scipy for scipy.stats
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        import_times[name] = time.perf_counter() - start
+        return module
+
+    class LazyModule(types.ModuleType):
+        """Stand-in that imports the real module on first attribute access."""
+
+        _module = None
+
+        def __getattr__(self, attr):
+            if self._module is None:
+                self._module = timed_import(self.__name__)
+                self.__dict__.update(self._module.__dict__)
+            return getattr(self._module, attr)
+
+    # altair, polars and scipy.stats dominate cold start but no slide needs them
+    # before Slide 1.2, so they load on first use; REVENUE_EAGER_IMPORTS=1 restores
+    # the old behaviour
+    eager_imports = os.environ.get("REVENUE_EAGER_IMPORTS") == "1"
+    import_module = timed_import if eager_imports else LazyModule
+
+    mo = timed_import("marimo")
+    np = timed_import("numpy")
+    alt = import_module("altair")
+    pl = import_module("polars")
+    stats = import_module("scipy.stats")
+
     warnings.filterwarnings("ignore", message=".*narwhals.*is_pandas_dataframe.*")
-    return alt, mo, np, pl, stats
+    return alt, import_times, mo, np, os, pl, stats, time
 
 
 @app.cell(hide_code=True)
-def _(mo):
+def _(mo, os, time):
+    # Per-cell, per-phase timing for the diagnostics panel (REVENUE_PROFILE=1 starts it enabled)
+    import json
+    from collections import deque
+
+    get_cell_timings, set_cell_timings = mo.state([])
+
+    class CellTimer:
+        """Lap timer for one run of a cell: ``lap(phase)`` records the time since the previous lap."""
+
+        def __init__(self, profiler, cell):
+            self.profiler = profiler
+            self.cell = cell
+            self.run = profiler.runs.get(cell, 0) + 1
+            profiler.runs[cell] = self.run
+            self._last = time.perf_counter()
+
+        def lap(self, phase):
+            now = time.perf_counter()
+            self.profiler.records.append(
+                {"cell": self.cell, "run": self.run, "phase": phase, "seconds": now - self._last, "timestamp": time.time()}
+            )
+            self._last = now
+
+        def done(self, phase):
+            """Record the final phase and refresh the diagnostics panel."""
+            self.lap(phase)
+            set_cell_timings(list(self.profiler.records))
+
+    class _NullTimer:
+        def lap(self, phase):
+            pass
+
+        def done(self, phase):
+            pass
+
+    class Profiler:
+        """Collects wall time per cell and phase (compute / chart / render) while enabled.
+
+        Only the latest ``max_records`` laps are kept, so a long session of
+        slider moves does not grow the log or the JSON export without bound.
+        """
+
+        def __init__(self, enabled=False, max_records=2000):
+            self.enabled = enabled
+            self.records = deque(maxlen=max_records)
+            self.runs = {}
+
+        def start(self, cell):
+            return CellTimer(self, cell) if self.enabled else _NullTimer()
+
+        def summary(self):
+            """Phase times of the latest run of every cell, in milliseconds."""
+            latest = {}
+            for record in self.records:
+                row = latest.get(record["cell"])
+                if row is None or row["run"] != record["run"]:
+                    row = latest[record["cell"]] = {"cell": record["cell"], "run": record["run"]}
+                row[record["phase"]] = round(row.get(record["phase"], 0) + record["seconds"] * 1e3, 2)
+            for row in latest.values():
+                row["total"] = round(sum(v for k, v in row.items() if k not in ("cell", "run")), 2)
+            return list(latest.values())
+
+        def to_json(self):
+            return json.dumps({"records": list(self.records), "summary": self.summary()}, indent=2)
+
+        def clear(self):
+            self.records.clear()
+            self.runs.clear()
+            set_cell_timings([])
+
+    profiler = Profiler(enabled=os.environ.get("REVENUE_PROFILE") == "1")
+
+    def _toggle_profiler(enabled):
+        profiler.enabled = enabled
+
+    # Toggling only flips the flag, so the slides are not re-run by the switch itself
+    profiler_switch = mo.ui.switch(value=profiler.enabled, label="Timing overlay", on_change=_toggle_profiler)
+    return get_cell_timings, profiler, profiler_switch
+
+
+@app.cell(hide_code=True)
+async def _(mo, os):
+    # Results precomputed at build time (python -m revenue_core.precompute), so the
+    # published deck does not re-run seed-fixed simulations in the browser
+    from revenue_core.precompute import BUNDLE_PATH, load_bundle
+
+    async def read_public_file(path):
+        """Bytes of a file under public/, from disk or, under Pyodide, from the site."""
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        try:
+            from pyodide.http import pyfetch
+        except ImportError:
+            return None
+        response = await pyfetch(str(mo.notebook_location() / path))
+        return await response.bytes() if response.ok else None
+
+    precomputed = load_bundle(await read_public_file(BUNDLE_PATH))
+    return (precomputed,)
+
+
+@app.cell(hide_code=True)
+def _(alt):
+    # Chart data layer: bin in NumPy and ship one row per bar, not one per simulated night
+    from revenue_core import histogram_bins
+
+    def histogram_chart(values, x_title, y_title, maxbins=10, step=None):
+        """Pre-aggregated equivalent of x=alt.X(bin=alt.Bin(maxbins=..., step=...)), y=count()."""
+        bins = histogram_bins(values, maxbins=maxbins, step=step)
+        rows = [
+            {"bin_start": start, "bin_end": end, "count": count}
+            for start, end, count in zip(bins["bin_start"], bins["bin_end"], bins["count"])
+        ]
+        return alt.Chart(alt.Data(values=rows)).encode(
+            x=alt.X("bin_start:Q", bin=alt.Bin(binned=True, step=bins["step"]), title=x_title),
+            x2="bin_end:Q",
+            y=alt.Y("count:Q", title=y_title),
+        )
+    return (histogram_chart,)
+
+
+@app.cell(hide_code=True)
+def _(mo, os):
     # Slide classes for consistent presentation layout
     from dataclasses import dataclass
-    from typing import Optional as _Optional, Any as _Any
+    from typing import Optional as _Optional, Any as _Any, Callable as _Callable
+    import hashlib as _hashlib
     import html as _html
+    import json as _json
+    import tempfile as _tempfile
 
     # Slide constants
     SLIDE_WIDTH = 1280
@@ -65,6 +276,139 @@ def _(mo):
     TITLE_FONT_SIZE = 28
     FOOTER_FONT_SIZE = 12
 
+    # Compiled slide templates: class references only, the rules live once in
+    # d3.css. Header and footer are spliced in here so a render is one format().
+    _HEADER = '<div class="slide-header"><div class="slide-title">{title}</div><div class="slide-hr"></div></div>'
+    _FOOTER = (
+        '<div class="slide-footer"><div class="slide-hr"></div><div class="slide-footer-row">'
+        '<div class="slide-footer-left">Page {page} &nbsp;&nbsp;|&nbsp;&nbsp; {chair}</div>'
+        '<div class="slide-footer-center">{logo}</div><div class="slide-footer-right">&nbsp;</div>'
+        "</div></div>"
+    )
+    _TEMPLATES = {
+        "title": (
+            '<div class="slide">' + _HEADER
+            + '<div class="slide-body title-center"><div class="title-stack">'
+            '<div class="title-slide-title">{title}</div>{subtitle}'
+            '<div class="title-slide-meta title-slide-course">{course}</div>'
+            '<div class="title-slide-meta title-slide-presenter">{presenter}</div>'
+            "</div></div>" + _FOOTER + "</div>"
+        ),
+        "section": (
+            '<div class="slide"><div class="slide-body section-center"><div class="section-stack">'
+            '{label}<div class="section-title">{title}</div>{agenda}'
+            "</div></div>" + _FOOTER + "</div>"
+        ),
+        "1-column": (
+            '<div class="slide">' + _HEADER
+            + '<div class="slide-body"><div class="slide-col tight-md">{left}</div></div>'
+            + _FOOTER + "</div>"
+        ),
+        "side-by-side": (
+            '<div class="slide">' + _HEADER
+            + '<div class="slide-body"><div class="slide-cols">'
+            '<div class="slide-col tight-md">{left}</div><div class="slide-col tight-md">{right}</div>'
+            "</div></div>" + _FOOTER + "</div>"
+        ),
+    }
+
+    def _content_html(content) -> str:
+        """Column content as HTML, wrapped like the mo.vstack the inline layouts use."""
+        if isinstance(content, str):
+            content = mo.md(content)
+        inner = mo.as_html(content).text if content is not None else mo.md("").text
+        return f'<div class="slide-content">{inner}</div>'
+
+    _NOTEBOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+    SLIDE_CACHE_DIR = os.path.join(_NOTEBOOK_DIR, "__marimo__", "cache", "slides")
+
+    # Bump when _compiled or _content_html change the markup they produce
+    SLIDE_RENDER_VERSION = 1
+
+    def _render_fingerprint() -> str:
+        """Hash of the render code version, every template and the stylesheet."""
+        digest = _hashlib.sha256(_json.dumps([SLIDE_RENDER_VERSION, _TEMPLATES]).encode())
+        try:
+            with open(os.path.join(_NOTEBOOK_DIR, "d3.css"), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+        return digest.hexdigest()
+
+    class SlideRenderCache:
+        """Rendered HTML of markdown-only slides, keyed on a hash of everything rendered.
+
+        Entries live in memory and as one file per hash under ``directory``, so a
+        cold start skips the markdown processing of unchanged slides. Pass
+        ``directory=None`` to keep the cache in memory only.
+        """
+
+        def __init__(self, directory: _Optional[str] = SLIDE_CACHE_DIR):
+            self.directory = directory
+            self.fingerprint = _render_fingerprint()
+            self.hits = 0
+            self.misses = 0
+            self._entries = {}
+
+        def key(self, slide: "Slide") -> str:
+            # The render fingerprint and marimo version cover changes to markup and markdown rendering
+            payload = [
+                self.fingerprint,
+                mo.__version__,
+                slide.title,
+                slide.subtitle,
+                slide.layout_type,
+                slide.page_number,
+                slide.chair,
+                slide.course,
+                slide.presenter,
+                slide.logo_url,
+                slide.content1,
+                slide.content2,
+            ]
+            return _hashlib.sha256(_json.dumps(payload).encode()).hexdigest()
+
+        def get(self, key: str) -> _Optional[str]:
+            html = self._entries.get(key)
+            if html is None and self.directory is not None:
+                try:
+                    with open(os.path.join(self.directory, f"{key}.html"), encoding="utf-8") as f:
+                        html = self._entries[key] = f.read()
+                except OSError:
+                    pass
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return html
+
+        def put(self, key: str, html: str) -> None:
+            self._entries[key] = html
+            if self.directory is None:
+                return
+            path = os.path.join(self.directory, f"{key}.html")
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                # Write a uniquely named file then rename, so concurrent sessions never
+                # share a temp file and a reader never sees a partial one
+                with _tempfile.NamedTemporaryFile(
+                    "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+                ) as f:
+                    f.write(html)
+                os.replace(f.name, path)
+            except OSError:
+                pass  # read-only checkout: keep the in-memory entry
+
+        def clear(self) -> None:
+            self._entries.clear()
+            if self.directory is not None and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith(".html"):
+                        os.remove(os.path.join(self.directory, name))
+
+        def info(self) -> dict:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
     @dataclass
     class Slide:
         title: str
@@ -77,6 +421,8 @@ def _(mo):
         subtitle: _Optional[str] = None
         content1: _Optional[_Any] = None
         content2: _Optional[_Any] = None
+        render_mode: str = "compiled"
+        cache: _Optional[SlideRenderCache] = None
 
         def _header(self) -> _Any:
             safe_title = _html.escape(self.title)
@@ -271,7 +617,58 @@ def _(mo):
                 """
             )
 
+        def _compiled(self) -> _Any:
+            layout = self.layout_type if self.layout_type in _TEMPLATES else "side-by-side"
+            fields = {
+                "title": _html.escape(self.title),
+                "page": _html.escape(str(self.page_number)),
+                "chair": _html.escape(self.chair),
+                "logo": (
+                    f'<img class="slide-logo" src="{_html.escape(self.logo_url)}" alt="logo">'
+                    if self.logo_url
+                    else "&nbsp;"
+                ),
+            }
+            if layout == "title":
+                fields["subtitle"] = (
+                    f'<div class="title-slide-sub">{_html.escape(self.subtitle)}</div>'
+                    if self.subtitle
+                    else ""
+                )
+                fields["course"] = _html.escape(self.course)
+                fields["presenter"] = _html.escape(self.presenter)
+            elif layout == "section":
+                fields["label"] = (
+                    f'<div class="section-label">{_html.escape(self.subtitle)}</div>'
+                    if self.subtitle
+                    else ""
+                )
+                agenda = mo.md(self.content1) if isinstance(self.content1, str) else self.content1
+                fields["agenda"] = (
+                    f'<div class="section-agenda">{agenda}</div>' if self.content1 else ""
+                )
+            else:
+                fields["left"] = _content_html(self.content1)
+                fields["right"] = _content_html(self.content2)
+            return mo.Html(_TEMPLATES[layout].format(**fields))
+
+        def _cacheable(self) -> bool:
+            # Only raw markdown is hashed; mo.md objects and UI elements are already built
+            return self.cache is not None and all(
+                c is None or isinstance(c, str) for c in (self.content1, self.content2)
+            )
+
         def render(self) -> _Any:
+            # "inline" keeps the self-contained markup for use outside this notebook
+            if self.render_mode == "compiled":
+                if not self._cacheable():
+                    return self._compiled()
+                key = self.cache.key(self)
+                html = self.cache.get(key)
+                if html is None:
+                    html = self._compiled().text
+                    self.cache.put(key, html)
+                return mo.Html(html)
             if self.layout_type == "title":
                 return self._title_layout()
             elif self.layout_type == "section":
@@ -287,11 +684,17 @@ def _(mo):
             course: str,
             presenter: str,
             logo_url: _Optional[str] = None,
+            render_mode: str = "compiled",
+            render_cache: _Optional[SlideRenderCache] = None,
+            lazy_slides: bool = False,
         ):
             self.chair = chair
             self.course = course
             self.presenter = presenter
             self.logo_url = logo_url
+            self.render_mode = render_mode
+            self.render_cache = render_cache
+            self.lazy_slides = lazy_slides
             self._page_counter = 0
 
         def styles(self) -> _Any:
@@ -443,6 +846,12 @@ def _(mo):
                 """
             )
 
+        def lazy(self, build: _Callable[[], _Any]) -> _Any:
+            """Run build() when the slide is first shown, with a loading indicator meanwhile."""
+            if not self.lazy_slides:
+                return build()
+            return mo.lazy(build, show_loading_indicator=True)
+
         def create_slide(
             self,
             title: str,
@@ -460,6 +869,8 @@ def _(mo):
                 logo_url=self.logo_url,
                 page_number=page_number,
                 layout_type=layout_type,
+                render_mode=self.render_mode,
+                cache=self.render_cache,
             )
 
         def create_title_slide(
@@ -471,7 +882,7 @@ def _(mo):
             slide = self.create_slide(title, layout_type="title", page_number=page_number)
             slide.subtitle = subtitle
             return slide
-    return (SlideCreator,)
+    return SlideCreator, SlideRenderCache
 
 
 @app.cell(hide_code=True)
@@ -484,22 +895,32 @@ def _():
 
 
 @app.cell(hide_code=True)
-def _(SlideCreator, lehrstuhl, presenter, vorlesung):
-    # Initialize slide creator
-    sc = SlideCreator(lehrstuhl, vorlesung, presenter)
+def _(SlideCreator, SlideRenderCache, lehrstuhl, os, presenter, vorlesung):
+    # Initialize slide creator; markdown-only slides reuse their HTML across sessions.
+    # Simulation slides compute when first shown; REVENUE_LAZY_SLIDES=0 runs them at start
+    sc = SlideCreator(
+        lehrstuhl,
+        vorlesung,
+        presenter,
+        render_cache=SlideRenderCache(),
+        lazy_slides=os.environ.get("REVENUE_LAZY_SLIDES", "1") != "0",
+    )
     return (sc,)
 
 
 @app.cell(hide_code=True)
-def _(sc):
+def _(profiler, sc):
     # Title slide
+    _timer = profiler.start("Title slide")
     title_slide = sc.create_title_slide(
         "Revenue Management",
         subtitle="Capacity Control",
         page_number=1,
     )
     sc.styles()
-    title_slide.render()
+    _html = title_slide.render()
+    _timer.done("render")
+    _html
     return
 
 
@@ -562,107 +983,84 @@ def _(mo, sc):
 
 
 @app.cell(hide_code=True)
-def _(alt, mo, np, pl, sc):
+def _(alt, histogram_chart, mo, pl, precomputed, profiler, sc):
     # Slide 1.2 — FCFS Simulation (Interactive discovery)
+    def _build():
+        from revenue_core import simulate_fcfs
 
-    def simulate_fcfs(n_simulations=1000, seed=1):
-        """Simulate FCFS policy outcomes."""
-        np.random.seed(seed)
-        C = 100  # capacity
-        r_L, r_H = 80, 200
-
-        results = []
-        for _ in range(n_simulations):
-            # Leisure demand (books first), typically exceeds capacity
-            leisure_demand = max(0, int(np.random.normal(120, 15)))
-            leisure_booked = min(leisure_demand, C)
-
-            # Business arrives late, higher uncertainty
-            business_demand = max(0, int(np.random.normal(50, 25)))
-            rooms_left = C - leisure_booked
-            business_booked = min(business_demand, rooms_left)
-            business_rejected = business_demand - business_booked
-
-            revenue = leisure_booked * r_L + business_booked * r_H
-            results.append(
-                {
-                    "Revenue": revenue,
-                    "Leisure Booked": leisure_booked,
-                    "Business Booked": business_booked,
-                    "Business Rejected": business_rejected,
-                    "Rooms Used": leisure_booked + business_booked,
-                }
-            )
-        return pl.DataFrame(results)
+        _timer = profiler.start("Slide 1.2")
 
-    # Run simulation
-    _fcfs_results = simulate_fcfs(n_simulations=1000)
+        # Run simulation
+        _fcfs_results = pl.DataFrame(precomputed.run(simulate_fcfs, n_simulations=1000))
 
-    # Compute summary stats
-    _mean_rev = _fcfs_results["Revenue"].mean()
-    _mean_leisure = _fcfs_results["Leisure Booked"].mean()
-    _mean_business = _fcfs_results["Business Booked"].mean()
-    _mean_rejected = _fcfs_results["Business Rejected"].mean()
+        # Compute summary stats
+        _mean_rev = _fcfs_results["Revenue"].mean()
+        _mean_leisure = _fcfs_results["Leisure Booked"].mean()
+        _mean_business = _fcfs_results["Business Booked"].mean()
+        _mean_rejected = _fcfs_results["Business Rejected"].mean()
 
-    # Create histogram
-    _hist = (
-        alt.Chart(alt.Data(values=_fcfs_results.to_dicts()))
-        .mark_bar(color="#2563eb", opacity=0.7)
-        .encode(
-            x=alt.X("Revenue:Q", bin=alt.Bin(maxbins=30), title="Daily Revenue (€)"),
-            y=alt.Y("count()", title="Frequency"),
+        _timer.lap("compute")
+
+        # Create histogram
+        _hist = (
+            histogram_chart(_fcfs_results["Revenue"].to_numpy(), "Daily Revenue (€)", "Frequency", maxbins=30)
+            .mark_bar(color="#2563eb", opacity=0.7)
+            .properties(width=480, height=280)
         )
-        .properties(width=480, height=280)
-    )
 
-    # Add mean line
-    _mean_rule = (
-        alt.Chart(alt.Data(values=pl.DataFrame({"x": [_mean_rev]}).to_dicts()))
-        .mark_rule(strokeDash=[5, 5], color="#dc2626", strokeWidth=2)
-        .encode(x="x:Q")
-    )
+        # Add mean line
+        _mean_rule = (
+            alt.Chart(alt.Data(values=pl.DataFrame({"x": [_mean_rev]}).to_dicts()))
+            .mark_rule(strokeDash=[5, 5], color="#dc2626", strokeWidth=2)
+            .encode(x="x:Q")
+        )
 
-    _chart = _hist + _mean_rule
+        _chart = _hist + _mean_rule
 
-    slide_1_2_fcfs = sc.create_slide(
-        "FCFS: The Natural Policy",
-        layout_type="side-by-side",
-        page_number=4,
-    )
+        slide_1_2_fcfs = sc.create_slide(
+            "FCFS: The Natural Policy",
+            layout_type="side-by-side",
+            page_number=4,
+        )
 
-    slide_1_2_fcfs.content1 = mo.md(
-        f"""
-    **First-Come-First-Served (FCFS)**
+        slide_1_2_fcfs.content1 = mo.md(
+            f"""
+        **First-Come-First-Served (FCFS)**
 
-    Accept bookings in order of arrival until sold out.
+        Accept bookings in order of arrival until sold out.
 
-    ---
+        ---
 
-    **Simulation: 1000 days of FCFS**
+        **Simulation: 1000 days of FCFS**
 
-    | Metric | Average |
-    |--------|---------|
-    | Revenue (avg.) | **€{_mean_rev:,.2f}** |
-    | Leisure rooms sold (avg.) | {_mean_leisure:.2f} |
-    | Business rooms sold (avg.) | {_mean_business:.2f} |
-    | **Business travelers turned away (avg.)** | **{_mean_rejected:.2f}** |
-    """
-    )
+        | Metric | Average |
+        |--------|---------|
+        | Revenue (avg.) | **€{_mean_rev:,.2f}** |
+        | Leisure rooms sold (avg.) | {_mean_leisure:.2f} |
+        | Business rooms sold (avg.) | {_mean_business:.2f} |
+        | **Business travelers turned away (avg.)** | **{_mean_rejected:.2f}** |
+        """
+        )
 
-    slide_1_2_fcfs.content2 = mo.vstack(
-        [
-            mo.md("**Revenue distribution under FCFS**"),
-            _chart,
-            mo.md(f"Mean revenue: €{_mean_rev:,.0f} (red dashed line)"),
-        ]
-    )
+        slide_1_2_fcfs.content2 = mo.vstack(
+            [
+                mo.md("**Revenue distribution under FCFS**"),
+                _chart,
+                mo.md(f"Mean revenue: €{_mean_rev:,.0f} (red dashed line)"),
+            ]
+        )
+
+        _timer.lap("chart")
+        _html = slide_1_2_fcfs.render()
+        _timer.done("render")
+        return _html
 
-    slide_1_2_fcfs.render()
+    sc.lazy(_build)
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 1.3 — Transition: Is FCFS Optimal?
     slide_1_3_transition = sc.create_slide(
         "Is FCFS the Best We Can Do?",
@@ -670,8 +1068,7 @@ def _(mo, sc):
         page_number=5,
     )
 
-    slide_1_3_transition.content1 = mo.md(
-        """
+    slide_1_3_transition.content1 = """
     **What we observed under FCFS:**
 
     - Revenue averages around **€8,000** per night
@@ -684,10 +1081,8 @@ def _(mo, sc):
     - We served 50 leisure travelers instead: 50 × €80 = **€4,000**
     - **Lost opportunity: €6,000 per night**
     """
-    )
 
-    slide_1_3_transition.content2 = mo.md(
-        """
+    slide_1_3_transition.content2 = """
     **A thought experiment:**
 
     What if we reserved some rooms for late-booking business travelers?
@@ -702,14 +1097,13 @@ def _(mo, sc):
 
     *How many rooms should we protect?*
     """
-    )
 
     slide_1_3_transition.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 1.4 — Key definitions (was 1.3)
     slide_1_4 = sc.create_slide(
         "Key definitions",
@@ -717,8 +1111,7 @@ def _(mo, sc):
         page_number=6,
     )
 
-    slide_1_4.content1 = mo.md(
-        """
+    slide_1_4.content1 = """
     | Symbol | Definition | Our Hotel Example |
     |--------|-----------|-------------------|
     | $C$ | Total capacity | 100 rooms |
@@ -732,15 +1125,16 @@ def _(mo, sc):
 
     **Booking limit** $B$ = maximum rooms we sell to low-fare customers
     """
-    )
 
     slide_1_4.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, np):
+def _(mo):
     # UI inputs for the booking limit interactive
+    from revenue_core import optimal_protection_level
+
     capacity_slider = mo.ui.slider(
         start=50, stop=200, step=10, value=100, label="Capacity (C)"
     )
@@ -759,50 +1153,7 @@ def _(mo, np):
     protection_slider = mo.ui.slider(
         start=0, stop=100, step=1, value=40, label="Protection level (Q)"
     )
-
-    # Assume unlimited leisure demand for simplicity
-    LEISURE_DEMAND = 200
-
-    def compute_metrics(C, r_L, r_H, mean_H, std_H, Q):
-        """Compute expected revenue and metrics for given protection level."""
-        # Booking limit
-        B = C - Q
-
-        # Generate demand distribution for high-fare (truncated at 0)
-        demands = np.arange(0, int(mean_H + 4 * std_H) + 1)
-        probs = np.exp(-0.5 * ((demands - mean_H) / std_H) ** 2)
-        probs = probs / probs.sum()
-
-        # Low-fare rooms sold (limited by booking limit B)
-        low_fare_sold = min(LEISURE_DEMAND, B)
-
-        # Expected high-fare sold and empty rooms
-        high_fare_sold_expected = 0
-        empty_expected = 0
-        for d, p in zip(demands, probs):
-            # High-fare demand can fill at most Q rooms (protected capacity)
-            high_sold = min(d, Q)
-            high_fare_sold_expected += p * high_sold
-            # Empty rooms = Q - min(D_H, Q) = max(0, Q - D_H)
-            empty_expected += p * max(0, Q - d)
-
-        # Expected revenue
-        revenue_expected = low_fare_sold * r_L + high_fare_sold_expected * r_H
-
-        # Rejected high-fare demand
-        rejected_expected = 0
-        for d, p in zip(demands, probs):
-            rejected_expected += p * max(0, d - Q)
-
-        return {
-            "booking_limit": B,
-            "low_fare_sold": low_fare_sold,
-            "high_fare_sold": high_fare_sold_expected,
-            "empty_rooms": empty_expected,
-            "rejected_high": rejected_expected,
-            "revenue": revenue_expected,
-        }
-    return
+    return (optimal_protection_level,)
 
 
 @app.cell(hide_code=True)
@@ -821,13 +1172,25 @@ def _(mo):
     )
 
 
+@app.cell(hide_code=True)
+def _(np, precomputed):
+    # Precomputed revenue curves behind the "Test this Q/Y" buttons (slides 1.5, 2.5)
+    from revenue_core import simulate_overbooking_curve, simulate_protection_curve
+
+    # Every value the sliders can reach, taken from the build-time bundle when it
+    # has them, else computed once at startup
+    explore_q_revenue = np.asarray(precomputed.run(simulate_protection_curve, list(range(0, 101))))
+    explore_y_revenue = np.asarray(precomputed.run(simulate_overbooking_curve, list(range(0, 31))))
+    return explore_q_revenue, explore_y_revenue
+
+
 @app.cell(hide_code=True)
 def _(
     alt,
+    explore_q_revenue,
     explore_q_slider,
     get_explored_q,
     mo,
-    np,
     pl,
     reset_exploration_btn,
     run_exploration_btn,
@@ -841,41 +1204,16 @@ def _(
         page_number=7,
     )
 
-    # Simulation parameters (fixed for exploration)
-    _C = 100
-    _r_L, _r_H = 80, 200
-    _mean_L, _std_L = 120, 15
-    _mean_H, _std_H = 50, 25
-
-    def _simulate_with_protection(Q, n_simulations=1000):
-        """Simulate revenue with a given protection level."""
-        np.random.seed(1)  # Reproducible per Q
-        B = _C - Q  # Booking limit for low-fare
-        revenues = []
-        for _ in range(n_simulations):
-            # Leisure demand (books first, limited by B)
-            leisure_demand = max(0, int(np.random.normal(_mean_L, _std_L)))
-            leisure_booked = min(leisure_demand, B)
-
-            # Business demand (gets protected rooms + any leftover)
-            business_demand = max(0, int(np.random.normal(_mean_H, _std_H)))
-            rooms_for_business = _C - leisure_booked
-            business_booked = min(business_demand, rooms_for_business)
-
-            revenue = leisure_booked * _r_L + business_booked * _r_H
-            revenues.append(revenue)
-        return np.mean(revenues)
-
     # Handle reset button
     _explored = get_explored_q()
     if reset_exploration_btn.value:
         set_explored_q({})
         _explored = {}
 
-    # Run simulation when button is clicked
+    # Look up the precomputed curve when button is clicked
     if run_exploration_btn.value:
         _Q = explore_q_slider.value
-        _rev = _simulate_with_protection(_Q)
+        _rev = float(explore_q_revenue[_Q])
         if _Q not in _explored:
             set_explored_q({**_explored, _Q: _rev})
             _explored = {**_explored, _Q: _rev}
@@ -933,7 +1271,7 @@ def _(
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 1.6 — The critical fractile formula
     slide_1_6 = sc.create_slide(
         "Finding the optimal protection level",
@@ -941,8 +1279,7 @@ def _(mo, sc):
         page_number=8,
     )
 
-    slide_1_6.content1 = mo.md(
-        r"""
+    slide_1_6.content1 = r"""
     **This is a newsvendor problem!**
 
     **Underage cost** $C_u$: Protect too few rooms
@@ -957,10 +1294,8 @@ def _(mo, sc):
 
     $$\frac{C_u}{C_u + C_o} = \frac{r_H - r_L}{r_H}$$
     """
-    )
 
-    slide_1_6.content2 = mo.md(
-        r"""
+    slide_1_6.content2 = r"""
     **Optimal protection level** $Q^*$:
 
     $$P(D_H \leq Q^*) = \frac{r_H - r_L}{r_H}$$
@@ -975,7 +1310,6 @@ def _(mo, sc):
 
     Find $Q^*$ where $P(D_H \leq Q^*) = 0.60$
     """
-    )
 
     slide_1_6.render()
     return
@@ -1005,11 +1339,14 @@ def _(
     explore_low_fare,
     mo,
     np,
+    optimal_protection_level,
     pl,
+    profiler,
     sc,
     stats,
 ):
     # Slide 1.7 — Explore what drives Q*
+    _timer = profiler.start("Slide 1.7")
     slide_1_7 = sc.create_slide(
         "Explore: What drives the optimal Q*?",
         layout_type="side-by-side",
@@ -1026,8 +1363,7 @@ def _(
     _crit_frac = (_r_H - _r_L) / _r_H
 
     # Compute optimal Q using inverse CDF
-    _Q_star = int(np.ceil(stats.norm.ppf(_crit_frac, _mean_H, _std_H)))
-    _Q_star = max(0, min(_Q_star, _C))
+    _Q_star = optimal_protection_level(_r_L, _r_H, _mean_H, _std_H, _C)
     _B_star = _C - _Q_star
 
     # Create demand distribution visualization
@@ -1035,6 +1371,8 @@ def _(
     _y = stats.norm.pdf(_x, _mean_H, _std_H)
     _dist_df = pl.DataFrame({"x": _x, "density": _y})
 
+    _timer.lap("compute")
+
     # Distribution curve
     _dist_curve = (
         alt.Chart(alt.Data(values=_dist_df.to_dicts()))
@@ -1100,12 +1438,15 @@ def _(
         mo.md(f"Shaded area = P(D_H ≤ Q*) = {_crit_frac:.1%}"),
     ])
 
-    slide_1_7.render()
+    _timer.lap("chart")
+    _html = slide_1_7.render()
+    _timer.done("render")
+    _html
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 1.8 — Managerial takeaway
     slide_1_8 = sc.create_slide(
         "Booking limits: Key insight",
@@ -1113,8 +1454,7 @@ def _(mo, sc):
         page_number=10,
     )
 
-    slide_1_8.content1 = mo.md(
-        r"""
+    slide_1_8.content1 = r"""
     **The goal is to protect upside, not punish low-fare customers**
 
     **What we learned:**
@@ -1132,7 +1472,6 @@ def _(mo, sc):
     When fares differ significantly and high-fare demand is uncertain,
     even imperfect protection levels substantially outperform FCFS.
     """
-    )
 
     slide_1_8.render()
     return
@@ -1153,7 +1492,7 @@ def _(sc):
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 2.1 — The Setting (neutral introduction)
     slide_2_1 = sc.create_slide(
         "The Setting: A Hotel's Reservation System",
@@ -1161,8 +1500,7 @@ def _(mo, sc):
         page_number=12,
     )
 
-    slide_2_1.content1 = mo.md(
-        """
+    slide_2_1.content1 = """
     **Your hotel:**
 
     - **100 rooms** available each night
@@ -1178,10 +1516,8 @@ def _(mo, sc):
     - Last-minute changes
     - "Just in case" bookings
     """
-    )
 
-    slide_2_1.content2 = mo.md(
-        """
+    slide_2_1.content2 = """
     **Historical data shows:**
 
     | Metric | Value |
@@ -1194,105 +1530,93 @@ def _(mo, sc):
 
     **Question:** What happens when we accept exactly 100 reservations?
     """
-    )
 
     slide_2_1.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(alt, mo, np, pl, sc):
+def _(alt, histogram_chart, mo, pl, precomputed, profiler, sc):
     # Slide 2.2 — No-show simulation (Discovery)
-    slide_2_2_sim = sc.create_slide(
-        "What Happens When We Book 100 Rooms?",
-        layout_type="side-by-side",
-        page_number=13,
-    )
+    def _build():
+        from revenue_core import simulate_exact_booking
+
+        _timer = profiler.start("Slide 2.2")
+        slide_2_2_sim = sc.create_slide(
+            "What Happens When We Book 100 Rooms?",
+            layout_type="side-by-side",
+            page_number=13,
+        )
 
-    def _simulate_exact_booking(n_simulations=1000, seed=2):
-        """Simulate outcomes when booking exactly 100 rooms."""
-        np.random.seed(seed)
-        C = 100  # capacity
-        noshow_rate = 0.10
-        r = 150  # room rate
-
-        results = []
-        for _ in range(n_simulations):
-            # Each guest has 10% chance of not showing
-            noshows = np.random.binomial(C, noshow_rate)
-            arrivals = C - noshows
-            empty_rooms = noshows
-            lost_revenue = empty_rooms * r
-            actual_revenue = arrivals * r
-            results.append({
-                "Arrivals": arrivals,
-                "Empty Rooms": empty_rooms,
-                "Lost Revenue": lost_revenue,
-                "Actual Revenue": actual_revenue,
-            })
-        return pl.DataFrame(results)
-
-    # Run simulation
-    _sim_results = _simulate_exact_booking(n_simulations=10000)
-
-    # Compute summary stats
-    _mean_arrivals = _sim_results["Arrivals"].mean()
-    _mean_empty = _sim_results["Empty Rooms"].mean()
-    _mean_lost = _sim_results["Lost Revenue"].mean()
-    _mean_revenue = _sim_results["Actual Revenue"].mean()
-
-    # Create histogram of revenue (use bin step=150 to align with discrete values)
-    _hist = (
-        alt.Chart(alt.Data(values=_sim_results.to_dicts()))
-        .mark_bar(color="#2563eb", opacity=0.7)
-        .encode(
-            x=alt.X("Actual Revenue:Q", bin=alt.Bin(step=150), title="Daily Revenue (€)"),
-            y=alt.Y("count()", title="Frequency (out of 1000 nights)"),
+        # Run simulation
+        _sim_results = pl.DataFrame(precomputed.run(simulate_exact_booking, n_simulations=10000))
+
+        # Compute summary stats
+        _mean_arrivals = _sim_results["Arrivals"].mean()
+        _mean_empty = _sim_results["Empty Rooms"].mean()
+        _mean_lost = _sim_results["Lost Revenue"].mean()
+        _mean_revenue = _sim_results["Actual Revenue"].mean()
+
+        _timer.lap("compute")
+
+        # Create histogram of revenue (use bin step=150 to align with discrete values)
+        _hist = (
+            histogram_chart(
+                _sim_results["Actual Revenue"].to_numpy(),
+                "Daily Revenue (€)",
+                "Frequency (out of 1000 nights)",
+                step=150,
+            )
+            .mark_bar(color="#2563eb", opacity=0.7)
+            .properties(width=500, height=280)
         )
-        .properties(width=500, height=280)
-    )
 
-    # Add mean line
-    _mean_rule = (
-        alt.Chart(alt.Data(values=pl.DataFrame({"x": [_mean_revenue]}).to_dicts()))
-        .mark_rule(strokeDash=[5, 5], color="#dc2626", strokeWidth=2)
-        .encode(x="x:Q")
-    )
+        # Add mean line
+        _mean_rule = (
+            alt.Chart(alt.Data(values=pl.DataFrame({"x": [_mean_revenue]}).to_dicts()))
+            .mark_rule(strokeDash=[5, 5], color="#dc2626", strokeWidth=2)
+            .encode(x="x:Q")
+        )
 
-    _chart = _hist + _mean_rule
+        _chart = _hist + _mean_rule
 
-    slide_2_2_sim.content1 = mo.md(
-        f"""
-    **Simulation: 1000 nights with 100 bookings**
+        slide_2_2_sim.content1 = mo.md(
+            f"""
+        **Simulation: 1000 nights with 100 bookings**
 
-    Each night:
-    - Accept exactly 100 reservations
-    - Each guest has ~10% chance of no-show
-    - Room rate: €150
+        Each night:
+        - Accept exactly 100 reservations
+        - Each guest has ~10% chance of no-show
+        - Room rate: €150
 
-    **Results:**
+        **Results:**
 
-    | Metric | Average |
-    |--------|---------|
-    | Guests who arrive (avg.) | **{_mean_arrivals:.2f}** |
-    | Empty rooms (avg.) | **{_mean_empty:.2f}** |
-    | Lost revenue (avg.) | **€{_mean_lost:,.2f}** |
-    | Actual revenue (avg.) | **€{_mean_revenue:,.2f}** |
-    """
-    )
+        | Metric | Average |
+        |--------|---------|
+        | Guests who arrive (avg.) | **{_mean_arrivals:.2f}** |
+        | Empty rooms (avg.) | **{_mean_empty:.2f}** |
+        | Lost revenue (avg.) | **€{_mean_lost:,.2f}** |
+        | Actual revenue (avg.) | **€{_mean_revenue:,.2f}** |
+        """
+        )
 
-    slide_2_2_sim.content2 = mo.vstack([
-        mo.md("**Daily revenue distribution**"),
-        _chart,
-        mo.md(f"*Mean revenue: €{_mean_revenue:,.2f}*"),
-    ])
+        slide_2_2_sim.content2 = mo.vstack([
+            mo.md("**Daily revenue distribution**"),
+            _chart,
+            mo.md(f"*Mean revenue: €{_mean_revenue:,.2f}*"),
+        ])
 
-    slide_2_2_sim.render()
+        _timer.lap("chart")
+        _html = slide_2_2_sim.render()
+        _timer.done("render")
+        return _html
+
+    sc.lazy(_build)
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 2.3 — Transition: Can we do better?
     slide_2_3_transition = sc.create_slide(
         "Can We Do Better?",
@@ -1300,8 +1624,7 @@ def _(mo, sc):
         page_number=14,
     )
 
-    slide_2_3_transition.content1 = mo.md(
-        """
+    slide_2_3_transition.content1 = """
     **What we just discovered:**
 
     - Booking exactly 100 rooms leaves **~10 rooms empty** on average
@@ -1316,10 +1639,8 @@ def _(mo, sc):
     *We're planning for a world where everyone shows up—
     but that almost never happens.*
     """
-    )
 
-    slide_2_3_transition.content2 = mo.md(
-        """
+    slide_2_3_transition.content2 = """
     **A thought experiment:**
 
     What if we sold **110 reservations** for 100 rooms?
@@ -1336,14 +1657,13 @@ def _(mo, sc):
 
     *Is the risk worth it? How much should we overbook?*
     """
-    )
 
     slide_2_3_transition.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 2.4 — Key definitions (moved from old 2.2)
     slide_2_4 = sc.create_slide(
         "Overbooking: Key definitions",
@@ -1351,8 +1671,7 @@ def _(mo, sc):
         page_number=15,
     )
 
-    slide_2_4.content1 = mo.md(
-        """
+    slide_2_4.content1 = """
     | Symbol | Definition | Example |
     |--------|-----------|---------|
     | $C$ | Physical capacity | 100 rooms |
@@ -1362,15 +1681,16 @@ def _(mo, sc):
     | $r$ | Revenue per customer | €150 |
     | $c_b$ | **Bumping cost** | Cost of denying a customer with reservation |
     """
-    )
 
     slide_2_4.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, np):
+def _(mo):
     # UI inputs for overbooking interactive
+    from revenue_core import optimal_overbooking_level
+
     ob_capacity_slider = mo.ui.slider(
         start=50, stop=200, step=10, value=100, label="Capacity (C)"
     )
@@ -1386,59 +1706,7 @@ def _(mo, np):
     ob_level_slider = mo.ui.slider(
         start=0, stop=30, step=1, value=10, label="Overbooking level (Y)"
     )
-
-    def compute_overbooking_metrics(C, r, c_bump, noshow_rate, Y):
-        """Compute expected revenue and metrics for given overbooking level."""
-        # Total reservations
-        total_reservations = C + Y
-
-        # No-shows follow binomial distribution
-        # Expected no-shows = total_reservations * noshow_rate
-        # Use normal approximation for simplicity
-        mean_noshows = total_reservations * noshow_rate
-        std_noshows = np.sqrt(total_reservations * noshow_rate * (1 - noshow_rate))
-
-        # Expected arrivals
-        expected_arrivals = total_reservations - mean_noshows
-
-        # Expected bumped customers = max(0, arrivals - C)
-        # This requires integration over the distribution
-        arrivals_range = np.arange(0, total_reservations + 1)
-        # Probability of each arrival count (binomial, approximate with normal)
-        probs = np.exp(-0.5 * ((arrivals_range - expected_arrivals) / max(std_noshows, 1)) ** 2)
-        probs = probs / probs.sum()
-
-        expected_bumped = 0
-        expected_empty = 0
-        prob_bumping = 0
-
-        for arrivals, p in zip(arrivals_range, probs):
-            if arrivals > C:
-                expected_bumped += p * (arrivals - C)
-                prob_bumping += p
-            else:
-                expected_empty += p * (C - arrivals)
-
-        # Expected revenue
-        expected_occupied = min(expected_arrivals, C)
-        expected_revenue = expected_arrivals * r - expected_bumped * c_bump
-        # More accurate: revenue from occupied rooms minus bump costs
-        expected_net_revenue = 0
-        for arrivals, p in zip(arrivals_range, probs):
-            occupied = min(arrivals, C)
-            bumped = max(0, arrivals - C)
-            expected_net_revenue += p * (occupied * r - bumped * c_bump)
-
-        return {
-            "total_reservations": total_reservations,
-            "expected_arrivals": expected_arrivals,
-            "expected_occupied": expected_occupied,
-            "expected_empty": expected_empty,
-            "expected_bumped": expected_bumped,
-            "prob_bumping": prob_bumping,
-            "expected_net_revenue": expected_net_revenue,
-        }
-    return
+    return (optimal_overbooking_level,)
 
 
 @app.cell(hide_code=True)
@@ -1460,10 +1728,10 @@ def _(mo):
 @app.cell(hide_code=True)
 def _(
     alt,
+    explore_y_revenue,
     explore_y_slider,
     get_explored_y,
     mo,
-    np,
     pl,
     reset_y_exploration_btn,
     run_y_exploration_btn,
@@ -1477,37 +1745,16 @@ def _(
         page_number=16,
     )
 
-    # Fixed parameters for exploration
-    _C = 100
-    _r = 150
-    _c_bump = 400
-    _noshow = 0.10
-
-    def _simulate_overbooking(Y, n_simulations=1000):
-        """Simulate net revenue for a given overbooking level."""
-        np.random.seed(1234)  # Reproducible
-        total_reservations = _C + Y
-        revenues = []
-        for _ in range(n_simulations):
-            # No-shows follow binomial
-            noshows = np.random.binomial(total_reservations, _noshow)
-            arrivals = total_reservations - noshows
-            occupied = min(arrivals, _C)
-            bumped = max(0, arrivals - _C)
-            revenue = occupied * _r - bumped * _c_bump
-            revenues.append(revenue)
-        return np.mean(revenues)
-
     # Handle reset button
     _explored = get_explored_y()
     if reset_y_exploration_btn.value:
         set_explored_y({})
         _explored = {}
 
-    # Run simulation when button is clicked
+    # Look up the precomputed curve when button is clicked
     if run_y_exploration_btn.value:
         _Y = explore_y_slider.value
-        _rev = _simulate_overbooking(_Y)
+        _rev = float(explore_y_revenue[_Y])
         if _Y not in _explored:
             set_explored_y({**_explored, _Y: _rev})
             _explored = {**_explored, _Y: _rev}
@@ -1569,7 +1816,7 @@ def _(
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 2.6 — The critical fractile for overbooking
     slide_2_6_crit = sc.create_slide(
         "Finding the optimal overbooking level",
@@ -1577,8 +1824,7 @@ def _(mo, sc):
         page_number=17,
     )
 
-    slide_2_6_crit.content1 = mo.md(
-        r"""
+    slide_2_6_crit.content1 = r"""
     **Again, a newsvendor problem!**
 
     **Underage cost** $C_u$: Overbook too little
@@ -1593,10 +1839,8 @@ def _(mo, sc):
 
     $$\frac{C_u}{C_u + C_o} = \frac{r}{r + c_b}$$
     """
-    )
 
-    slide_2_6_crit.content2 = mo.md(
-        r"""
+    slide_2_6_crit.content2 = r"""
     **Optimal overbooking level** $Y^*$:
 
     $$P(X \leq Y^*) = \frac{r}{r + c_b}$$
@@ -1611,7 +1855,6 @@ def _(mo, sc):
 
     $$\frac{150}{150 + 400} \approx 0.27$$
     """
-    )
 
     slide_2_6_crit.render()
     return
@@ -1634,11 +1877,14 @@ def _(
     explore_ob_revenue,
     mo,
     np,
+    optimal_overbooking_level,
     pl,
+    profiler,
     sc,
     stats,
 ):
     # Slide 2.7 — Explore what drives Y*
+    _timer = profiler.start("Slide 2.7")
     slide_2_7_sensitivity = sc.create_slide(
         "Explore: What drives the optimal Y*?",
         layout_type="side-by-side",
@@ -1657,7 +1903,7 @@ def _(
     # No-shows from base capacity ~ Binomial(C, noshow_rate) ≈ Normal
     _ns_mean = _C * _noshow
     _ns_std = max(np.sqrt(_C * _noshow * (1 - _noshow)), 1)
-    _Y_star = max(0, int(np.floor(stats.norm.ppf(_crit_frac, _ns_mean, _ns_std))))
+    _Y_star = optimal_overbooking_level(_C, _r, _c_bump, _noshow)
 
     # Expected bumped customers at Y*
     # When no-shows < Y*, we bump (Y* - no-shows) customers
@@ -1669,6 +1915,8 @@ def _(
     _y = stats.norm.pdf(_x, _ns_mean, max(_ns_std, 1))
     _dist_df = pl.DataFrame({"x": _x, "density": _y})
 
+    _timer.lap("compute")
+
     # Distribution curve
     _dist_curve = (
         alt.Chart(alt.Data(values=_dist_df.to_dicts()))
@@ -1736,12 +1984,15 @@ def _(
         mo.md(f"Shaded area = P(no-shows ≤ Y*) = {_actual_prob:.1%}"),
     ])
 
-    slide_2_7_sensitivity.render()
+    _timer.lap("chart")
+    _html = slide_2_7_sensitivity.render()
+    _timer.done("render")
+    _html
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 2.8 — Managerial takeaway
     slide_2_8_insight = sc.create_slide(
         "Overbooking: Key insight",
@@ -1749,8 +2000,7 @@ def _(mo, sc):
         page_number=19,
     )
 
-    slide_2_8_insight.content1 = mo.md(
-        r"""
+    slide_2_8_insight.content1 = r"""
     **Overbooking is insurance against no-shows**
 
     **What we learned:**
@@ -1768,7 +2018,6 @@ def _(mo, sc):
     Airlines, hotels, and restaurants all overbook — the question isn't *whether* to overbook,
     but *how much*. The answer depends on your bumping cost, which includes reputation effects.
     """
-    )
 
     slide_2_8_insight.render()
     return
@@ -1789,7 +2038,7 @@ def _(sc):
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 3.1 — The Story So Far (recap)
     slide_3_1 = sc.create_slide(
         "The story so far",
@@ -1797,8 +2046,7 @@ def _(mo, sc):
         page_number=21,
     )
 
-    slide_3_1.content1 = mo.md(
-        """
+    slide_3_1.content1 = """
     **We now have two levers for revenue management**
 
     **Lever 1: Booking Limits** (Section 1)
@@ -1811,10 +2059,8 @@ def _(mo, sc):
     - Solution: Accept Y* extra reservations
     - Reduces waste from "empty rooms"
     """
-    )
 
-    slide_3_1.content2 = mo.md(
-        r"""
+    slide_3_1.content2 = r"""
     **Each lever solves ONE problem**
 
     | Lever | Waste Addressed | Key Trade-off |
@@ -1828,319 +2074,195 @@ def _(mo, sc):
     - Mixed fare classes → need booking limits
     - Most hotels and airlines face BOTH simultaneously
     """
-    )
 
     slide_3_1.render()
     return
 
 
 @app.cell(hide_code=True)
-def _(np, pl, stats):
+def _(pl, precomputed):
     # Combined simulation function
-    def simulate_combined_policy(
-        C, r_L, r_H, c_bump, Q, Y, mean_H, std_H, noshow_rate, n_simulations=5000
-    ):
-        """Simulate revenue outcomes under combined policy."""
-        np.random.seed(1)
-
-        B = (C + Y) - Q  # Booking limit for low-fare
-        total_capacity = C + Y
-
-        revenues = []
-        bumped_list = []
-        empty_list = []
-        high_rejected_list = []
-
-        for _ in range(n_simulations):
-            # Low-fare demand (assume always exceeds booking limit)
-            low_fare_booked = B
-
-            # High-fare demand realization
-            high_demand = max(0, int(np.random.normal(mean_H, std_H)))
-            high_fare_booked = min(high_demand, Q)
-            high_rejected = max(0, high_demand - Q)
-
-            total_booked = low_fare_booked + high_fare_booked
-
-            # No-shows
-            noshows = np.random.binomial(total_booked, noshow_rate)
-            arrivals = total_booked - noshows
-
-            # Outcomes
-            occupied = min(arrivals, C)
-            bumped = max(0, arrivals - C)
-            empty = max(0, C - arrivals)
-
-            # Approximate revenue attribution
-            # Assume high-fare customers arrive proportionally
-            high_arrivals = int(high_fare_booked * (1 - noshow_rate))
-            low_arrivals = arrivals - high_arrivals
-
-            revenue = min(low_arrivals, C) * r_L
-            if low_arrivals < C:
-                revenue += min(high_arrivals, C - low_arrivals) * r_H
-            revenue -= bumped * c_bump
-
-            revenues.append(revenue)
-            bumped_list.append(bumped)
-            empty_list.append(empty)
-            high_rejected_list.append(high_rejected)
-
-        return {
-            "mean_revenue": np.mean(revenues),
-            "std_revenue": np.std(revenues),
-            "mean_bumped": np.mean(bumped_list),
-            "mean_empty": np.mean(empty_list),
-            "mean_rejected_high": np.mean(high_rejected_list),
-            "revenues": revenues,
-        }
+    from revenue_core import run_policy_comparison as _policy_comparison
 
-    def run_policy_comparison(C, r_L, r_H, c_bump, mean_H, std_H, noshow_rate):
-        """Compare four policies."""
-        # 1. FCFS only (Q=0, Y=0)
-        fcfs = simulate_combined_policy(
-            C, r_L, r_H, c_bump, Q=0, Y=0, mean_H=mean_H, std_H=std_H, noshow_rate=noshow_rate
-        )
+    def run_policy_comparison(*args, **kwargs):
+        """revenue_core.run_policy_comparison as a polars DataFrame for the slides."""
+        return pl.DataFrame(precomputed.run(_policy_comparison, *args, **kwargs))
+
+    return (run_policy_comparison,)
 
-        # 2. Booking limits only (optimal Q, Y=0)
-        crit_frac_bl = (r_H - r_L) / r_H
-        Q_star = int(np.ceil(stats.norm.ppf(crit_frac_bl, mean_H, std_H)))
-        Q_star = max(0, min(Q_star, C))
-        bl_only = simulate_combined_policy(
-            C, r_L, r_H, c_bump, Q=Q_star, Y=0, mean_H=mean_H, std_H=std_H, noshow_rate=noshow_rate
+
+@app.cell(hide_code=True)
+def _(alt, mo, pl, run_policy_comparison, sc):
+    # Slide 3.2 — What's Missing? (simulation with bar chart)
+    def _build():
+        slide_3_2 = sc.create_slide(
+            "What's missing?",
+            layout_type="side-by-side",
+            page_number=22,
         )
 
-        # 3. Overbooking only (Q=0, optimal Y)
-        # No-shows ~ Binomial(C, noshow_rate) ≈ Normal(C·p, √(C·p·(1-p)))
-        # Y* = floor(ppf(critical_ratio)) - accept while F(Y) ≤ critical_ratio
-        crit_frac_ob = r_L / (r_L + c_bump)
-        ns_mean = C * noshow_rate
-        ns_std = max(np.sqrt(C * noshow_rate * (1 - noshow_rate)), 1)
-        Y_star = max(0, int(np.floor(stats.norm.ppf(crit_frac_ob, ns_mean, ns_std))))
-        ob_only = simulate_combined_policy(
-            C, r_L, r_H, c_bump, Q=0, Y=Y_star, mean_H=mean_H, std_H=std_H, noshow_rate=noshow_rate
+        # Get comparison data
+        _comparison_df = run_policy_comparison(
+            C=100, r_L=80, r_H=200, c_bump=400, mean_H=50, std_H=15, noshow_rate=0.10
         )
 
-        # 4. Combined (optimal Q on effective capacity, optimal Y)
-        C_eff = C + Y_star
-        Q_combined = int(np.ceil(stats.norm.ppf(crit_frac_bl, mean_H, std_H)))
-        Q_combined = max(0, min(Q_combined, C_eff))
-        combined = simulate_combined_policy(
-            C,
-            r_L,
-            r_H,
-            c_bump,
-            Q=Q_combined,
-            Y=Y_star,
-            mean_H=mean_H,
-            std_H=std_H,
-            noshow_rate=noshow_rate,
+        # Filter to only 3 policies for discovery - Combined is revealed in Slide 3.4
+        _df_three = _comparison_df.filter(pl.col("Policy") != "Combined")
+
+        # Create bar chart for revenue comparison
+        _revenue_chart = (
+            alt.Chart(alt.Data(values=_df_three.to_dicts()))
+            .mark_bar()
+            .encode(
+                x=alt.X("Policy:N", sort=["FCFS", "Booking Limits", "Overbooking"], title=None),
+                y=alt.Y("Revenue:Q", title="Average Revenue (€)"),
+                color=alt.Color(
+                    "Policy:N",
+                    scale=alt.Scale(
+                        domain=["FCFS", "Booking Limits", "Overbooking"],
+                        range=["#94a3b8", "#3b82f6", "#f59e0b"],
+                    ),
+                    legend=None,
+                ),
+            )
+            .properties(width=280, height=200, title="Revenue by Policy")
         )
 
-        return pl.DataFrame(
+        # Create stacked bar for waste sources (only 3 policies)
+        # Convert to lists for WASM compatibility
+        _empty_list = _df_three["Empty"].to_list()
+        _rejected_list = _df_three["Rejected High"].to_list()
+        _waste_data = pl.DataFrame(
             {
-                "Policy": ["FCFS", "Booking Limits", "Overbooking", "Combined"],
-                "Q": [0, Q_star, 0, Q_combined],
-                "Y": [0, 0, Y_star, Y_star],
-                "Revenue": [
-                    fcfs["mean_revenue"],
-                    bl_only["mean_revenue"],
-                    ob_only["mean_revenue"],
-                    combined["mean_revenue"],
-                ],
-                "Empty": [
-                    fcfs["mean_empty"],
-                    bl_only["mean_empty"],
-                    ob_only["mean_empty"],
-                    combined["mean_empty"],
-                ],
-                "Bumped": [
-                    fcfs["mean_bumped"],
-                    bl_only["mean_bumped"],
-                    ob_only["mean_bumped"],
-                    combined["mean_bumped"],
-                ],
-                "Rejected High": [
-                    fcfs["mean_rejected_high"],
-                    bl_only["mean_rejected_high"],
-                    ob_only["mean_rejected_high"],
-                    combined["mean_rejected_high"],
+                "Policy": ["FCFS", "FCFS", "Booking Limits", "Booking Limits", "Overbooking", "Overbooking"],
+                "Waste Type": ["Empty Rooms", "Rejected High-Fare", "Empty Rooms", "Rejected High-Fare", "Empty Rooms", "Rejected High-Fare"],
+                "Count": [
+                    _empty_list[0], _rejected_list[0],
+                    _empty_list[1], _rejected_list[1],
+                    _empty_list[2], _rejected_list[2],
                 ],
             }
         )
-    return run_policy_comparison, simulate_combined_policy
-
 
-@app.cell(hide_code=True)
-def _(alt, mo, pl, run_policy_comparison, sc):
-    # Slide 3.2 — What's Missing? (simulation with bar chart)
-    slide_3_2 = sc.create_slide(
-        "What's missing?",
-        layout_type="side-by-side",
-        page_number=22,
-    )
-
-    # Get comparison data
-    _comparison_df = run_policy_comparison(
-        C=100, r_L=80, r_H=200, c_bump=400, mean_H=50, std_H=15, noshow_rate=0.10
-    )
-
-    # Filter to only 3 policies for discovery - Combined is revealed in Slide 3.4
-    _df_three = _comparison_df.filter(pl.col("Policy") != "Combined")
-
-    # Create bar chart for revenue comparison
-    _revenue_chart = (
-        alt.Chart(alt.Data(values=_df_three.to_dicts()))
-        .mark_bar()
-        .encode(
-            x=alt.X("Policy:N", sort=["FCFS", "Booking Limits", "Overbooking"], title=None),
-            y=alt.Y("Revenue:Q", title="Average Revenue (€)"),
-            color=alt.Color(
-                "Policy:N",
-                scale=alt.Scale(
-                    domain=["FCFS", "Booking Limits", "Overbooking"],
-                    range=["#94a3b8", "#3b82f6", "#f59e0b"],
+        _waste_chart = (
+            alt.Chart(alt.Data(values=_waste_data.to_dicts()))
+            .mark_bar()
+            .encode(
+                x=alt.X("Policy:N", sort=["FCFS", "Booking Limits", "Overbooking"], title=None),
+                y=alt.Y("Count:Q", title="Average Count"),
+                color=alt.Color(
+                    "Waste Type:N",
+                    scale=alt.Scale(domain=["Empty Rooms", "Rejected High-Fare"], range=["#ef4444", "#f97316"]),
                 ),
-                legend=None,
-            ),
+                xOffset="Waste Type:N",
+            )
+            .properties(width=280, height=200, title="Sources of Waste")
         )
-        .properties(width=280, height=200, title="Revenue by Policy")
-    )
 
-    # Create stacked bar for waste sources (only 3 policies)
-    # Convert to lists for WASM compatibility
-    _empty_list = _df_three["Empty"].to_list()
-    _rejected_list = _df_three["Rejected High"].to_list()
-    _waste_data = pl.DataFrame(
-        {
-            "Policy": ["FCFS", "FCFS", "Booking Limits", "Booking Limits", "Overbooking", "Overbooking"],
-            "Waste Type": ["Empty Rooms", "Rejected High-Fare", "Empty Rooms", "Rejected High-Fare", "Empty Rooms", "Rejected High-Fare"],
-            "Count": [
-                _empty_list[0], _rejected_list[0],
-                _empty_list[1], _rejected_list[1],
-                _empty_list[2], _rejected_list[2],
-            ],
-        }
-    )
+        slide_3_2.content1 = mo.vstack(
+            [
+                mo.md(
+                    """
+        **Simulating a hotel with BOTH problems**
 
-    _waste_chart = (
-        alt.Chart(alt.Data(values=_waste_data.to_dicts()))
-        .mark_bar()
-        .encode(
-            x=alt.X("Policy:N", sort=["FCFS", "Booking Limits", "Overbooking"], title=None),
-            y=alt.Y("Count:Q", title="Average Count"),
-            color=alt.Color(
-                "Waste Type:N",
-                scale=alt.Scale(domain=["Empty Rooms", "Rejected High-Fare"], range=["#ef4444", "#f97316"]),
-            ),
-            xOffset="Waste Type:N",
+        **Scenario:** 100 rooms, €80/€200 fares, 10% no-shows
+
+        Let's test each lever in isolation:
+        - **FCFS**: No protection, no overbooking
+        - **Booking limits only**: Protect for high-fare, but no overbooking
+        - **Overbooking only**: Overbook, but no fare protection
+        """
+                ),
+                mo.ui.altair_chart(_revenue_chart),
+            ]
         )
-        .properties(width=280, height=200, title="Sources of Waste")
-    )
 
-    slide_3_2.content1 = mo.vstack(
-        [
-            mo.md(
-                """
-    **Simulating a hotel with BOTH problems**
+        slide_3_2.content2 = mo.vstack(
+            [
+                mo.ui.altair_chart(_waste_chart),
+                mo.md(
+                    """
+        **What each lever misses:**
 
-    **Scenario:** 100 rooms, €80/€200 fares, 10% no-shows
+        | Policy | Empty Rooms | High-Fare Rejected |
+        |--------|-------------|-------------------|
+        | Booking limits only | ✓ Still has empties (no-shows) | Low |
+        | Overbooking only | Low | ✓ Misses high-fare protection |
 
-    Let's test each lever in isolation:
-    - **FCFS**: No protection, no overbooking
-    - **Booking limits only**: Protect for high-fare, but no overbooking
-    - **Overbooking only**: Overbook, but no fare protection
-    """
-            ),
-            mo.ui.altair_chart(_revenue_chart),
-        ]
-    )
-
-    slide_3_2.content2 = mo.vstack(
-        [
-            mo.ui.altair_chart(_waste_chart),
-            mo.md(
-                """
-    **What each lever misses:**
+        *Each lever alone leaves value on the table!*
+        """
+                ),
+            ]
+        )
 
-    | Policy | Empty Rooms | High-Fare Rejected |
-    |--------|-------------|-------------------|
-    | Booking limits only | ✓ Still has empties (no-shows) | Low |
-    | Overbooking only | Low | ✓ Misses high-fare protection |
+        return slide_3_2.render()
 
-    *Each lever alone leaves value on the table!*
-    """
-            ),
-        ]
-    )
-
-    slide_3_2.render()
+    sc.lazy(_build)
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, run_policy_comparison, sc):
+def _(run_policy_comparison, sc):
     # Slide 3.3 — Can We Use Both? (transition)
-    slide_3_3 = sc.create_slide(
-        "Can we use both?",
-        layout_type="side-by-side",
-        page_number=23,
-    )
-
-    # Get comparison data to show specific numbers
-    _comp_df = run_policy_comparison(
-        C=100, r_L=80, r_H=200, c_bump=400, mean_H=50, std_H=15, noshow_rate=0.10
-    )
+    def _build():
+        slide_3_3 = sc.create_slide(
+            "Can we use both?",
+            layout_type="side-by-side",
+            page_number=23,
+        )
 
-    # Convert to lists for WASM compatibility
-    _rev_list = _comp_df["Revenue"].to_list()
-    _empty_list = _comp_df["Empty"].to_list()
-    _rejected_list = _comp_df["Rejected High"].to_list()
-    _bl_rev = _rev_list[1]
-    _bl_empty = _empty_list[1]
-    _ob_rev = _rev_list[2]
-    _ob_rejected = _rejected_list[2]
-
-    slide_3_3.content1 = mo.md(
-        f"""
-    **The gap in each approach**
-
-    **Booking limits alone:**
-    - Revenue: €{_bl_rev:,.0f}
-    - But: {_bl_empty:.1f} empty rooms (from no-shows)
-    - *Good at fare protection, bad at filling rooms*
-
-    **Overbooking alone:**
-    - Revenue: €{_ob_rev:,.0f}
-    - But: {_ob_rejected:.1f} high-fare customers rejected
-    - *Good at filling rooms, bad at fare protection*
-    """
-    )
+        # Get comparison data to show specific numbers
+        _comp_df = run_policy_comparison(
+            C=100, r_L=80, r_H=200, c_bump=400, mean_H=50, std_H=15, noshow_rate=0.10
+        )
 
-    slide_3_3.content2 = mo.md(
+        # Convert to lists for WASM compatibility
+        _rev_list = _comp_df["Revenue"].to_list()
+        _empty_list = _comp_df["Empty"].to_list()
+        _rejected_list = _comp_df["Rejected High"].to_list()
+        _bl_rev = _rev_list[1]
+        _bl_empty = _empty_list[1]
+        _ob_rev = _rev_list[2]
+        _ob_rejected = _rejected_list[2]
+
+        slide_3_3.content1 = f"""
+        **The gap in each approach**
+
+        **Booking limits alone:**
+        - Revenue: €{_bl_rev:,.0f}
+        - But: {_bl_empty:.1f} empty rooms (from no-shows)
+        - *Good at fare protection, bad at filling rooms*
+
+        **Overbooking alone:**
+        - Revenue: €{_ob_rev:,.0f}
+        - But: {_ob_rejected:.1f} high-fare customers rejected
+        - *Good at filling rooms, bad at fare protection*
         """
-    **The opportunity**
 
-    What if we combined both levers?
+        slide_3_3.content2 = """
+        **The opportunity**
 
-    - Use **overbooking** to fill no-show gaps
-    - Use **booking limits** to protect high-fare seats
+        What if we combined both levers?
 
-    **The challenge:** How do they interact?
-    - If we overbook, we have more total capacity...
-    - But we still need to protect for high-fare...
-    - Does one lever affect the other?
+        - Use **overbooking** to fill no-show gaps
+        - Use **booking limits** to protect high-fare seats
 
-    *Let's develop a systematic approach!*
-    """
-    )
+        **The challenge:** How do they interact?
+        - If we overbook, we have more total capacity...
+        - But we still need to protect for high-fare...
+        - Does one lever affect the other?
+
+        *Let's develop a systematic approach!*
+        """
+
+        return slide_3_3.render()
 
-    slide_3_3.render()
+    sc.lazy(_build)
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 3.4 — The Sequential Heuristic
     slide_3_4 = sc.create_slide(
         "The sequential heuristic",
@@ -2148,8 +2270,7 @@ def _(mo, sc):
         page_number=24,
     )
 
-    slide_3_4.content1 = mo.md(
-        """
+    slide_3_4.content1 = """
     **A simple sequential approach**
 
     We can combine both levers using a **two-step heuristic**:
@@ -2170,10 +2291,8 @@ def _(mo, sc):
 
     *This is known as the **virtual capacity method**.*
     """
-    )
 
-    slide_3_4.content2 = mo.md(
-        r"""
+    slide_3_4.content2 = r"""
     **The combined policy**
 
     **Booking limit for low-fare:**
@@ -2192,12 +2311,88 @@ def _(mo, sc):
     - Accept up to 108 total bookings
     - Protect 54 seats for high-fare
     """
-    )
 
     slide_3_4.render()
     return
 
 
+@app.cell(hide_code=True)
+def _(np, os, pl, precomputed):
+    # Precomputed sensitivity cube behind the Slide 3.5 sliders
+    import functools
+
+    from revenue_core import SENSITIVITY_GRID, sensitivity_cube as _sensitivity_cube
+    from revenue_core.precompute import source_fingerprint as _source_fingerprint
+
+    # A local cache next to the notebook, never part of the published site
+    SENSITIVITY_CUBE_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "__marimo__", "cache", "sensitivity_cube_v1.arrow"
+    )
+
+    def sensitivity_cube_fingerprint(C=100, r_L=80, mean_H=50, std_H=15):
+        """SHA-256 over the slider grid, the model parameters and the revenue_core sources."""
+        import hashlib
+        import json
+
+        key = {
+            "grid": {name: values.tolist() for name, values in SENSITIVITY_GRID.items()},
+            "params": {"C": C, "r_L": r_L, "mean_H": mean_H, "std_H": std_H},
+            "sources": _source_fingerprint(),
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def build_sensitivity_cube(path=SENSITIVITY_CUBE_PATH, C=100, r_L=80, mean_H=50, std_H=15):
+        """Evaluate the four policies for every slider state and store them as Arrow IPC.
+
+        The file's schema metadata records the fingerprint it was built for.
+        Without pyarrow or a writable directory the cube is only kept in memory.
+        """
+        cube = pl.DataFrame(_sensitivity_cube(C, r_L, mean_H, std_H))
+        try:
+            import pyarrow as pa
+
+            table = cube.to_arrow().replace_schema_metadata(
+                {"fingerprint": sensitivity_cube_fingerprint(C, r_L, mean_H, std_H)}
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with pa.ipc.new_file(path, table.schema) as writer:
+                writer.write_table(table)
+        except (ImportError, OSError):
+            pass
+        return cube
+
+    def load_sensitivity_cube(path=SENSITIVITY_CUBE_PATH):
+        """Take the cube from the build-time bundle, else memory-map it, rebuilding it if missing or stale."""
+        bundled = precomputed.get(_sensitivity_cube)
+        if bundled is not None:
+            return pl.DataFrame(bundled)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return build_sensitivity_cube(path)
+
+        if os.path.exists(path):
+            table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+            metadata = table.schema.metadata or {}
+            if metadata.get(b"fingerprint") == sensitivity_cube_fingerprint().encode():
+                return pl.from_arrow(table)
+        return build_sensitivity_cube(path)
+
+    # Loaded on the first lookup, i.e. when Slide 3.5 first renders
+    sensitivity_cube = functools.cache(load_sensitivity_cube)
+
+    def sensitivity_lookup(noshow_rate, fare_ratio, bump_ratio):
+        """Return the cube row for one slider state (row-major grid index)."""
+        idx = 0
+        for name, value in zip(SENSITIVITY_GRID, (noshow_rate, fare_ratio, bump_ratio)):
+            grid = SENSITIVITY_GRID[name]
+            step = grid[1] - grid[0]
+            i = int(np.clip(round((value - grid[0]) / step), 0, len(grid) - 1))
+            idx = idx * len(grid) + i
+        return sensitivity_cube().row(idx, named=True)
+    return (sensitivity_lookup,)
+
+
 @app.cell(hide_code=True)
 def _(mo):
     # State for Slide 3.5 — Sensitivity analysis sliders
@@ -2217,16 +2412,16 @@ def _(mo):
 def _(
     alt,
     mo,
-    np,
     pl,
+    profiler,
     sc,
     sensitivity_bump_ratio,
     sensitivity_fare_ratio,
+    sensitivity_lookup,
     sensitivity_noshow,
-    simulate_combined_policy,
-    stats,
 ):
     # Slide 3.5 — How Much Does Combining Help?
+    _timer = profiler.start("Slide 3.5")
     slide_3_5 = sc.create_slide(
         "How much does combining help?",
         layout_type="side-by-side",
@@ -2234,53 +2429,31 @@ def _(
     )
 
     # Fixed base parameters
-    _C = 100
     _r_L = 80
-    _mean_H = 50
-    _std_H = 15
 
     # Variable parameters from sliders
     _noshow_rate = sensitivity_noshow.value
     _fare_ratio = sensitivity_fare_ratio.value
     _bump_ratio = sensitivity_bump_ratio.value
-    _r_H = _r_L * _fare_ratio
-    _c_bump = _r_L * _bump_ratio
 
-    # Calculate optimal Y (simpler textbook approach)
-    # No-shows from base capacity ~ Binomial(C, noshow_rate) ≈ Normal
-    _crit_frac_ob = _r_L / (_r_L + _c_bump)
-    _ns_mean = _C * _noshow_rate
-    _ns_std = max(np.sqrt(_C * _noshow_rate * (1 - _noshow_rate)), 1)
-    _Y_star = max(0, int(np.floor(stats.norm.ppf(_crit_frac_ob, _ns_mean, _ns_std))))
-
-    # Calculate optimal Q
-    _crit_frac_bl = (_r_H - _r_L) / _r_H
-    _Q_star = int(np.ceil(stats.norm.ppf(_crit_frac_bl, _mean_H, _std_H)))
-    _Q_star = max(0, min(_Q_star, _C + _Y_star))
-
-    # Simulate four policies
-    _fcfs = simulate_combined_policy(
-        _C, _r_L, _r_H, _c_bump, Q=0, Y=0,
-        mean_H=_mean_H, std_H=_std_H, noshow_rate=_noshow_rate
-    )
-    _bl_only = simulate_combined_policy(
-        _C, _r_L, _r_H, _c_bump, Q=_Q_star, Y=0,
-        mean_H=_mean_H, std_H=_std_H, noshow_rate=_noshow_rate
-    )
-    _ob_only = simulate_combined_policy(
-        _C, _r_L, _r_H, _c_bump, Q=0, Y=_Y_star,
-        mean_H=_mean_H, std_H=_std_H, noshow_rate=_noshow_rate
-    )
-    _combined = simulate_combined_policy(
-        _C, _r_L, _r_H, _c_bump, Q=_Q_star, Y=_Y_star,
-        mean_H=_mean_H, std_H=_std_H, noshow_rate=_noshow_rate
-    )
+    # Optimal Q*, Y* and the four policies' revenues, precomputed per slider state
+    _state = sensitivity_lookup(_noshow_rate, _fare_ratio, _bump_ratio)
+    _r_H = _state["r_H"]
+    _c_bump = _state["c_bump"]
+    _Q_star = _state["Q_star"]
+    _Y_star = _state["Y_star"]
+    _fcfs = {"mean_revenue": _state["revenue_fcfs"]}
+    _bl_only = {"mean_revenue": _state["revenue_booking_limits"]}
+    _ob_only = {"mean_revenue": _state["revenue_overbooking"]}
+    _combined = {"mean_revenue": _state["revenue_combined"]}
 
     # Calculate gains
     _best_single = max(_bl_only["mean_revenue"], _ob_only["mean_revenue"])
     _gain_vs_single = _combined["mean_revenue"] - _best_single
     _gain_pct = (_gain_vs_single / _best_single) * 100 if _best_single > 0 else 0
 
+    _timer.lap("compute")
+
     # Create comparison bar chart
     _compare_df = pl.DataFrame({
         "Policy": ["FCFS (No RM)", "Booking Limits Only", "Overbooking Only", "Combined"],
@@ -2343,12 +2516,15 @@ def _(
         ]
     )
 
-    slide_3_5.render()
+    _timer.lap("chart")
+    _html = slide_3_5.render()
+    _timer.done("render")
+    _html
     return
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 3.6 — Key Insight (synthesis)
     slide_3_6 = sc.create_slide(
         "Key insight: Both levers work together",
@@ -2356,8 +2532,7 @@ def _(mo, sc):
         page_number=26,
     )
 
-    slide_3_6.content1 = mo.md(
-        """
+    slide_3_6.content1 = """
     **What we discovered:**
 
     1. **Each lever alone is incomplete**
@@ -2374,16 +2549,13 @@ def _(mo, sc):
        - Then compute Q* on effective capacity
        - Order matters: overbooking expands the "pie"
     """
-    )
 
-    slide_3_6.content2 = mo.md(
-        """
+    slide_3_6.content2 = """
     **In practice:**
     - Airlines/hotels use these principles with many fare classes
     - Modern RM systems automate the optimization
     - The core trade-offs we explored remain the same
     """
-    )
 
     slide_3_6.render()
     return
@@ -2403,7 +2575,7 @@ def _(sc):
 
 
 @app.cell(hide_code=True)
-def _(mo, sc):
+def _(sc):
     # Slide 4.1 — Summary
     slide_4_1 = sc.create_slide(
         "Capacity control: The big picture",
@@ -2411,8 +2583,7 @@ def _(mo, sc):
         page_number=28,
     )
 
-    slide_4_1.content1 = mo.md(
-        r"""
+    slide_4_1.content1 = r"""
     **Allocate scarce, perishable capacity under uncertainty**
 
     | Lever | Problem Addressed | Key Trade-off |
@@ -2429,11 +2600,34 @@ def _(mo, sc):
     - Segmentable customers
     - Demand uncertainty
     """
-    )
 
     slide_4_1.render()
     return
 
 
+@app.cell(hide_code=True)
+def _(get_cell_timings, import_times, mo, profiler, profiler_switch):
+    # Diagnostics panel: timing overlay switch, latest per-phase timings, JSON export
+    get_cell_timings()  # re-run whenever a timed cell finishes
+
+    _items = [profiler_switch]
+    if profiler_switch.value:
+        _summary = profiler.summary()
+        _items += [
+            mo.ui.table(_summary, selection=None, label="Latest run per cell (ms)")
+            if _summary
+            else mo.md("*Move a slider on Slide 1.7, 2.7 or 3.5 to record timings.*"),
+            mo.md("**Library imports:** " + ", ".join(f"{k} {v * 1e3:.0f} ms" for k, v in import_times.items())),
+            mo.download(
+                data=profiler.to_json().encode(),
+                filename="cell_timings.json",
+                mimetype="application/json",
+                label="Export timings (JSON)",
+            ),
+        ]
+    mo.vstack(_items)
+    return
+
+
 if __name__ == "__main__":
     app.run()
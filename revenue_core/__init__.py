@@ -0,0 +1,81 @@
+"""Revenue-management models behind the revenue.py notebook.
+
+Imports only NumPy and SciPy, so batch jobs can use the models without
+marimo, altair or polars. scipy.stats is imported inside the functions that
+need it, keeping ``import revenue_core`` to roughly the cost of NumPy.
+Everything listed in ``__all__`` is the stable API.
+"""
+
+from .adaptive import (
+    simulate_adaptive,
+    simulate_combined_policy_adaptive,
+    simulate_exact_booking_adaptive,
+    simulate_fcfs_adaptive,
+    simulate_overbooking_curve_adaptive,
+    simulate_protection_curve_adaptive,
+)
+from .booking import LEISURE_DEMAND, compute_metrics, compute_metrics_curve, optimal_protection_level, simulate_fcfs
+from .cache import SimulationCache, simulation_cache
+from .combined import POLICIES, evaluate_combined_policy, run_policy_comparison, simulate_combined_policy
+from .dynamic import dp_booking_control, simulate_bid_price_control
+from .emsr import emsr_a, emsr_b, nested_booking_limits, simulate_nested_booking
+from .exploration import simulate_overbooking_curve, simulate_protection_curve
+from .histogram import histogram_bins, vega_bin
+from .overbooking import (
+    compute_overbooking_curve,
+    compute_overbooking_metrics,
+    optimal_overbooking_level,
+    simulate_exact_booking,
+)
+from .sampling import UniformSampler, randomized_qmc
+from .sensitivity import SENSITIVITY_GRID, sensitivity_cube
+from .simulation import simulate_combined_policy_grid, simulate_combined_policy_vr
+from .sweep import RESULT_FIELDS, SCENARIO_FIELDS, run_sweep, scenario_grid
+from .variance import antithetic_normal, antithetic_uniform, variance_reduced_mean
+
+__all__ = [
+    "LEISURE_DEMAND",
+    "POLICIES",
+    "RESULT_FIELDS",
+    "SCENARIO_FIELDS",
+    "SENSITIVITY_GRID",
+    "SimulationCache",
+    "UniformSampler",
+    "antithetic_normal",
+    "antithetic_uniform",
+    "compute_metrics",
+    "compute_metrics_curve",
+    "compute_overbooking_curve",
+    "compute_overbooking_metrics",
+    "dp_booking_control",
+    "emsr_a",
+    "emsr_b",
+    "evaluate_combined_policy",
+    "histogram_bins",
+    "nested_booking_limits",
+    "optimal_overbooking_level",
+    "optimal_protection_level",
+    "randomized_qmc",
+    "run_policy_comparison",
+    "run_sweep",
+    "scenario_grid",
+    "sensitivity_cube",
+    "simulate_adaptive",
+    "simulate_bid_price_control",
+    "simulate_combined_policy",
+    "simulate_combined_policy_adaptive",
+    "simulate_combined_policy_grid",
+    "simulate_combined_policy_vr",
+    "simulate_exact_booking",
+    "simulate_exact_booking_adaptive",
+    "simulate_fcfs",
+    "simulate_fcfs_adaptive",
+    "simulate_nested_booking",
+    "simulate_overbooking_curve",
+    "simulate_overbooking_curve_adaptive",
+    "simulate_protection_curve",
+    "simulate_protection_curve_adaptive",
+    "simulation_cache",
+    "variance_reduced_mean",
+    "vega_bin",
+]
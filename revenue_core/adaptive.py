@@ -0,0 +1,113 @@
+"""Adaptive Monte Carlo: simulate in chunks until the revenue CI is tight enough."""
+
+import numpy as np
+
+from .booking import simulate_fcfs
+from .exploration import simulate_overbooking_curve, simulate_protection_curve
+from .overbooking import simulate_exact_booking
+from .simulation import simulate_combined_policy_grid
+
+
+def simulate_adaptive(
+    sample,
+    tol,
+    confidence=0.95,
+    chunk_size=1000,
+    min_samples=2000,
+    max_samples=1_000_000,
+    seed=1,
+):
+    """Call ``sample(rng, n)`` in chunks until the CI half-width is at most ``tol``.
+
+    ``sample`` returns simulated revenues with the nights on the last axis;
+    leading axes (e.g. a policy grid) all have to meet the tolerance.
+    Mean and variance are merged chunk by chunk, so memory stays bounded.
+    """
+    from scipy import stats
+
+    rng = np.random.default_rng(seed)
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    n, mean, m2 = 0, 0.0, 0.0
+    while True:
+        x = np.asarray(sample(rng, min(chunk_size, max_samples - n)), dtype=float)
+        n_chunk = x.shape[-1]
+        mean_chunk = x.mean(axis=-1)
+        m2_chunk = ((x - mean_chunk[..., None]) ** 2).sum(axis=-1)
+
+        # Chan et al. parallel update of the running mean and sum of squares
+        delta = mean_chunk - mean
+        total = n + n_chunk
+        mean = mean + delta * n_chunk / total
+        m2 = m2 + m2_chunk + delta**2 * n * n_chunk / total
+        n = total
+
+        std = np.sqrt(m2 / max(n - 1, 1))
+        half_width = z * std / np.sqrt(n)
+        converged = bool(np.all(half_width <= tol))
+        if (n >= min_samples and converged) or n >= max_samples:
+            break
+
+    return {
+        "mean_revenue": mean,
+        "std_revenue": std,
+        "half_width": half_width,
+        "n_simulations": n,
+        "converged": converged,
+    }
+
+
+def simulate_combined_policy_adaptive(
+    C, r_L, r_H, c_bump, Q, Y, mean_H, std_H, noshow_rate, tol, seed=1, **kwargs
+):
+    """Adaptive version of simulate_combined_policy_grid for a revenue CI tolerance."""
+    grid_kwargs = {k: kwargs.pop(k) for k in ("outer", "crn") if k in kwargs}
+
+    def sample(rng, n):
+        return simulate_combined_policy_grid(
+            C, r_L, r_H, c_bump, Q, Y, mean_H, std_H, noshow_rate,
+            n_simulations=n, seed=rng, summarize=False, **grid_kwargs,
+        )["revenue"]
+
+    return simulate_adaptive(sample, tol, seed=seed, **kwargs)
+
+
+def simulate_fcfs_adaptive(tol, seed=1, **kwargs):
+    """Adaptive version of simulate_fcfs for a revenue CI tolerance."""
+
+    def sample(rng, n):
+        return simulate_fcfs(n, seed=rng)["Revenue"]
+
+    return simulate_adaptive(sample, tol, seed=seed, **kwargs)
+
+
+def simulate_exact_booking_adaptive(tol, seed=2, **kwargs):
+    """Adaptive version of simulate_exact_booking for a revenue CI tolerance."""
+
+    def sample(rng, n):
+        return simulate_exact_booking(n, seed=rng)["Actual Revenue"]
+
+    return simulate_adaptive(sample, tol, seed=seed, **kwargs)
+
+
+def simulate_protection_curve_adaptive(Q, tol, seed=1, antithetic=False, **kwargs):
+    """Adaptive version of simulate_protection_curve; every Q has to meet the tolerance.
+
+    With ``antithetic=True`` the chunk sizes have to stay even.
+    """
+
+    def sample(rng, n):
+        return simulate_protection_curve(Q, n, seed=rng, antithetic=antithetic, summarize=False)
+
+    return simulate_adaptive(sample, tol, seed=seed, **kwargs)
+
+
+def simulate_overbooking_curve_adaptive(Y, tol, seed=1234, antithetic=False, **kwargs):
+    """Adaptive version of simulate_overbooking_curve; every Y has to meet the tolerance.
+
+    With ``antithetic=True`` the chunk sizes have to stay even.
+    """
+
+    def sample(rng, n):
+        return simulate_overbooking_curve(Y, n, seed=rng, antithetic=antithetic, summarize=False)
+
+    return simulate_adaptive(sample, tol, seed=seed, **kwargs)
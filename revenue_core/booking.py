@@ -0,0 +1,99 @@
+"""Booking limits: the newsvendor protection level and its expected outcomes."""
+
+import numpy as np
+
+# Assume unlimited leisure demand for simplicity
+LEISURE_DEMAND = 200
+
+
+def optimal_protection_level(r_L, r_H, mean_H, std_H, C=None):
+    """Q* = F^-1((r_H - r_L) / r_H) for normal high-fare demand, rounded up and capped at C."""
+    from scipy import stats
+
+    crit_frac = (r_H - r_L) / r_H
+    Q_star = max(0, int(np.ceil(stats.norm.ppf(crit_frac, mean_H, std_H))))
+    return Q_star if C is None else min(Q_star, C)
+
+
+def compute_metrics_curve(C, r_L, r_H, mean_H, std_H, Q=None, leisure_demand=LEISURE_DEMAND):
+    """Compute expected revenue and metrics for every protection level at once.
+
+    ``Q`` defaults to 0..C; every metric comes back as an array over ``Q``.
+    """
+    Q = np.arange(C + 1) if Q is None else np.asarray(Q, dtype=np.int64)
+
+    # Booking limit
+    B = C - Q
+
+    # Generate demand distribution for high-fare (truncated at 0)
+    demands = np.arange(0, int(mean_H + 4 * std_H) + 1)
+    probs = np.exp(-0.5 * ((demands - mean_H) / std_H) ** 2)
+    probs = probs / probs.sum()
+
+    # Low-fare rooms sold (limited by booking limit B)
+    low_fare_sold = np.minimum(leisure_demand, B)
+
+    # Empty protected rooms: E[max(0, Q - D_H)] = sum_{k < Q} P(D_H <= k)
+    n_cdf = max(len(demands), int(Q.max(initial=0)))
+    cdf = np.ones(n_cdf)
+    cdf[: len(demands)] = np.cumsum(probs)
+    empty_expected = np.concatenate([[0.0], np.cumsum(cdf)])[Q]
+
+    # High-fare demand can fill at most Q rooms: E[min(D_H, Q)] = Q - E[max(0, Q - D_H)]
+    high_fare_sold_expected = Q - empty_expected
+
+    # Expected revenue
+    revenue_expected = low_fare_sold * r_L + high_fare_sold_expected * r_H
+
+    # Rejected high-fare demand: E[max(0, D_H - Q)] = E[D_H] - E[min(D_H, Q)]
+    rejected_expected = np.dot(demands, probs) - high_fare_sold_expected
+
+    return {
+        "booking_limit": B,
+        "low_fare_sold": low_fare_sold,
+        "high_fare_sold": high_fare_sold_expected,
+        "empty_rooms": empty_expected,
+        "rejected_high": rejected_expected,
+        "revenue": revenue_expected,
+    }
+
+
+def compute_metrics(C, r_L, r_H, mean_H, std_H, Q, leisure_demand=LEISURE_DEMAND):
+    """Compute expected revenue and metrics for given protection level."""
+    curve = compute_metrics_curve(C, r_L, r_H, mean_H, std_H, Q=[Q], leisure_demand=leisure_demand)
+    return {k: v[0].item() for k, v in curve.items()}
+
+
+def simulate_fcfs(n_simulations=1000, seed=1, sampler=None):
+    """Simulate FCFS policy outcomes, one array entry per night.
+
+    A ``sampler`` (e.g. UniformSampler("sobol")) replaces the Generator
+    draws with inverse-CDF transforms of its uniforms.
+    """
+    rng = np.random.default_rng(seed)
+    C = 100  # capacity
+    r_L, r_H = 80, 200
+
+    # Column 0: leisure demand (books first), typically exceeds capacity
+    # Column 1: business demand (arrives late), higher uncertainty
+    if sampler is None:
+        demand = rng.normal([120, 50], [15, 25], size=(n_simulations, 2))
+    else:
+        from scipy import stats
+
+        demand = stats.norm.ppf(sampler.random(n_simulations, 2), [120, 50], [15, 25])
+    demand = np.maximum(demand, 0).astype(np.int64)
+    leisure_demand, business_demand = demand[:, 0], demand[:, 1]
+
+    leisure_booked = np.minimum(leisure_demand, C)
+    rooms_left = C - leisure_booked
+    business_booked = np.minimum(business_demand, rooms_left)
+    business_rejected = business_demand - business_booked
+
+    return {
+        "Revenue": leisure_booked * r_L + business_booked * r_H,
+        "Leisure Booked": leisure_booked,
+        "Business Booked": business_booked,
+        "Business Rejected": business_rejected,
+        "Rooms Used": leisure_booked + business_booked,
+    }
@@ -0,0 +1,69 @@
+"""Size-bounded memoization shared by the simulation entry points."""
+
+import functools
+import inspect
+from collections import OrderedDict
+
+
+class SimulationCache:
+    """Size-bounded LRU cache for simulation results, keyed on call arguments.
+
+    Cached results are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def memoize(self, fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Normalize positional/keyword/default spellings of the same call
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, tuple(bound.arguments.items()))
+            try:
+                result = self._entries[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable arguments (e.g. arrays) bypass the cache
+                return fn(*args, **kwargs)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+
+            self.misses += 1
+            result = fn(*args, **kwargs)
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return result
+
+        return wrapper
+
+    def invalidate(self, fn=None):
+        """Drop all cached results, or only those of one memoized function."""
+        if fn is None:
+            self._entries.clear()
+            return
+        name = fn if isinstance(fn, str) else fn.__name__
+        for key in [k for k in self._entries if k[0] == name]:
+            del self._entries[key]
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+simulation_cache = SimulationCache(maxsize=256)
@@ -0,0 +1,205 @@
+"""Combined policy: legacy simulator, exact evaluator and the four-policy comparison."""
+
+import numpy as np
+
+from .booking import optimal_protection_level
+from .cache import simulation_cache
+from .overbooking import optimal_overbooking_level
+from .simulation import simulate_combined_policy_grid
+
+POLICIES = ("FCFS", "Booking Limits", "Overbooking", "Combined")
+
+
+@simulation_cache.memoize
+def simulate_combined_policy(
+    C, r_L, r_H, c_bump, Q, Y, mean_H, std_H, noshow_rate, n_simulations=5000
+):
+    """Simulate revenue outcomes under combined policy."""
+    # Private stream with the same draws as the old np.random.seed(1), no global state
+    random = np.random.RandomState(1)
+
+    B = max((C + Y) - Q, 0)  # Booking limit for low-fare
+    total_capacity = C + Y
+
+    revenues = []
+    bumped_list = []
+    empty_list = []
+    high_rejected_list = []
+
+    for _ in range(n_simulations):
+        # Low-fare demand (assume always exceeds booking limit)
+        low_fare_booked = B
+
+        # High-fare demand realization
+        high_demand = max(0, int(random.normal(mean_H, std_H)))
+        high_fare_booked = min(high_demand, Q)
+        high_rejected = max(0, high_demand - Q)
+
+        total_booked = low_fare_booked + high_fare_booked
+
+        # No-shows
+        noshows = random.binomial(total_booked, noshow_rate)
+        arrivals = total_booked - noshows
+
+        # Outcomes
+        occupied = min(arrivals, C)
+        bumped = max(0, arrivals - C)
+        empty = max(0, C - arrivals)
+
+        # Approximate revenue attribution
+        # Assume high-fare customers arrive proportionally
+        high_arrivals = int(high_fare_booked * (1 - noshow_rate))
+        low_arrivals = arrivals - high_arrivals
+
+        revenue = min(low_arrivals, C) * r_L
+        if low_arrivals < C:
+            revenue += min(high_arrivals, C - low_arrivals) * r_H
+        revenue -= bumped * c_bump
+
+        revenues.append(revenue)
+        bumped_list.append(bumped)
+        empty_list.append(empty)
+        high_rejected_list.append(high_rejected)
+
+    return {
+        "mean_revenue": np.mean(revenues),
+        "std_revenue": np.std(revenues),
+        "mean_bumped": np.mean(bumped_list),
+        "mean_empty": np.mean(empty_list),
+        "mean_rejected_high": np.mean(high_rejected_list),
+        "revenues": revenues,
+    }
+
+
+def evaluate_combined_policy(
+    C, r_L, r_H, c_bump, Q, Y, mean_H, std_H, noshow_rate, outer=True
+):
+    """Exact expected outcomes of the combined policy, vectorized over Q and Y.
+
+    High-fare demand is the discretized normal of the simulator,
+    max(0, int(N(mean_H, std_H))). Given h high-fare bookings, arrivals are
+    the convolution of the low- and high-class show-up binomials, i.e.
+    Binomial(B + h, 1 - noshow_rate), with the simulator's revenue
+    attribution applied to every (arrivals, h) outcome.
+    """
+    from scipy import stats
+
+    Q = np.asarray(Q, dtype=np.int64)
+    Y = np.asarray(Y, dtype=np.int64)
+    if outer:
+        Q, Y = np.ix_(np.atleast_1d(Q), np.atleast_1d(Y))
+    Q, Y = np.broadcast_arrays(Q, Y)
+    B = np.maximum((C + Y) - Q, 0)  # Booking limit for low-fare
+    show_rate = 1 - noshow_rate
+
+    # Discretized high-fare demand: P(D <= k) = P(X < k + 1), tail folded into K
+    K = max(int(Q.max(initial=0)), int(np.ceil(mean_H + 10 * std_H))) + 1
+    cdf_D = stats.norm.cdf((np.arange(K + 1) + 1 - mean_H) / std_H)
+    cdf_D[-1] = 1.0
+    pmf_D = np.diff(cdf_D, prepend=0.0)
+
+    # Rejected high-fare demand: E[max(0, D - Q)] = sum_{j >= Q} P(D > j)
+    tail_sums = np.cumsum((1 - cdf_D)[::-1])[::-1]
+    rejected_high = tail_sums[Q]
+
+    # High-fare bookings h = min(D, Q), weights w[..., h]
+    h = np.arange(int(Q.max(initial=0)) + 1)
+    p_at_least_Q = 1 - np.concatenate([[0.0], cdf_D])[Q]
+    w = np.where(h < Q[..., None], pmf_D[h], 0.0)
+    w = w + (h == Q[..., None]) * p_at_least_Q[..., None]
+
+    # Arrivals pmf for every booking total n: binom[n, a] = P(A = a | n booked)
+    N = int(B.max(initial=0)) + h[-1]
+    a = np.arange(N + 1)
+    binom = stats.binom.pmf(a[None, :], a[:, None], show_rate)
+
+    # Revenue of every (arrivals, h) outcome, same attribution as the simulator
+    high_arrivals = (h * show_rate).astype(np.int64)[None, :]
+    low_arrivals = a[:, None] - high_arrivals
+    bumped = np.maximum(a - C, 0)
+    revenue = (
+        np.minimum(low_arrivals, C) * r_L
+        + np.where(low_arrivals < C, np.minimum(high_arrivals, C - low_arrivals), 0) * r_H
+        - bumped[:, None] * c_bump
+    )
+
+    # Condition on the booking total, then average over h
+    revenue_given_n = binom @ revenue
+    n = B[..., None] + h
+    return {
+        "mean_revenue": (w * revenue_given_n[n, h]).sum(axis=-1),
+        "mean_bumped": (w * (binom @ bumped)[n]).sum(axis=-1),
+        "mean_empty": (w * (binom @ np.maximum(C - a, 0))[n]).sum(axis=-1),
+        "mean_rejected_high": rejected_high,
+        "prob_bumping": (w * (binom @ (a > C))[n]).sum(axis=-1),
+    }
+
+
+@simulation_cache.memoize
+def run_policy_comparison(
+    C,
+    r_L,
+    r_H,
+    c_bump,
+    mean_H,
+    std_H,
+    noshow_rate,
+    method="exact",
+    crn=False,
+    n_simulations=5000,
+    seed=1,
+):
+    """Compare four policies; returns a dict of columns, one entry per policy.
+
+    ``method="exact"`` uses evaluate_combined_policy (noise-free),
+    ``method="simulate"`` runs simulate_combined_policy per policy. With
+    ``crn=True`` the simulated policies share one set of demand and
+    show-up random numbers, so their differences have far lower variance;
+    ``seed`` applies to this path only.
+    """
+    # 1. FCFS only (Q=0, Y=0), nothing to optimize
+
+    # 2. Booking limits only (optimal Q, Y=0)
+    Q_star = optimal_protection_level(r_L, r_H, mean_H, std_H, C)
+
+    # 3. Overbooking only (Q=0, optimal Y), low fare is the marginal room's revenue
+    Y_star = optimal_overbooking_level(C, r_L, c_bump, noshow_rate)
+
+    # 4. Combined (optimal Q on effective capacity, optimal Y)
+    Q_combined = optimal_protection_level(r_L, r_H, mean_H, std_H, C + Y_star)
+
+    Qs = [0, Q_star, 0, Q_combined]
+    Ys = [0, 0, Y_star, Y_star]
+    if method == "exact":
+        exact = evaluate_combined_policy(
+            C, r_L, r_H, c_bump, Q=Qs, Y=Ys, mean_H=mean_H, std_H=std_H,
+            noshow_rate=noshow_rate, outer=False,
+        )
+        results = [{k: float(v[i]) for k, v in exact.items()} for i in range(len(Qs))]
+    elif method == "simulate" and crn:
+        sim = simulate_combined_policy_grid(
+            C, r_L, r_H, c_bump, Q=Qs, Y=Ys, mean_H=mean_H, std_H=std_H,
+            noshow_rate=noshow_rate, n_simulations=n_simulations, seed=seed,
+            outer=False, crn=True,
+        )
+        results = [{k: float(v[i]) for k, v in sim.items()} for i in range(len(Qs))]
+    elif method == "simulate":
+        results = [
+            simulate_combined_policy(
+                C, r_L, r_H, c_bump, Q=Q, Y=Y, mean_H=mean_H, std_H=std_H,
+                noshow_rate=noshow_rate, n_simulations=n_simulations,
+            )
+            for Q, Y in zip(Qs, Ys)
+        ]
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
+
+    return {
+        "Policy": list(POLICIES),
+        "Q": Qs,
+        "Y": Ys,
+        "Revenue": [r["mean_revenue"] for r in results],
+        "Empty": [r["mean_empty"] for r in results],
+        "Bumped": [r["mean_bumped"] for r in results],
+        "Rejected High": [r["mean_rejected_high"] for r in results],
+    }
@@ -0,0 +1,84 @@
+"""Dynamic booking control: backward induction over the booking horizon.
+
+Time runs in periods short enough for at most one request each. Row t of
+``arrival_probs`` holds P(a class j request arrives in period t), in
+calendar order with the last row just before arrival. Fares are ordered
+highest first, as in revenue_core.emsr.
+"""
+
+import numpy as np
+
+
+def dp_booking_control(C, fares, arrival_probs):
+    """Optimal accept/reject policy for every period and remaining capacity.
+
+    Solves V_t(x) = V_{t+1}(x) + sum_j p_tj max(r_j - dV_{t+1}(x), 0) with one
+    vectorized Bellman update over the capacity axis per period. The bid price
+    dV_{t+1}(x) = V_{t+1}(x) - V_{t+1}(x-1) is the value of the x-th remaining
+    seat after period t; a class j request in period t with x seats left is
+    accepted iff r_j >= bid_prices[t, x - 1].
+
+    Returns a dict with
+      bid_prices         (T, C) float32
+      protection_levels  (T, k-1) int32, seats held back for classes 1..j
+                         against class j+1 in each period
+      expected_revenue   (C+1,) value of starting the horizon with 0..C seats
+    """
+    fares = np.asarray(fares, dtype=float)
+    probs = np.atleast_2d(np.asarray(arrival_probs, dtype=float))
+    if probs.shape[-1] != fares.shape[-1]:
+        raise ValueError("arrival_probs needs one column per fare class")
+    if (probs < 0).any() or (probs.sum(axis=-1) > 1 + 1e-9).any():
+        raise ValueError("Each period's arrival probabilities must be >= 0 and sum to at most 1")
+    T, k = probs.shape
+
+    value = np.zeros(C + 1)
+    bid_prices = np.empty((T, C), dtype=np.float32)
+    protection = np.empty((T, k - 1), dtype=np.int32)
+    gain = np.empty((k, C))
+    for t in range(T - 1, -1, -1):
+        delta = np.diff(value)
+        bid_prices[t] = delta
+        # dV is non-increasing in x, so the seats worth more than r_{j+1} are a prefix
+        protection[t] = np.searchsorted(-delta, -fares[1:], side="left")
+        np.subtract(fares[:, None], delta, out=gain)
+        np.maximum(gain, 0, out=gain)
+        value[1:] += probs[t] @ gain
+
+    return {"bid_prices": bid_prices, "protection_levels": protection, "expected_revenue": value}
+
+
+def simulate_bid_price_control(C, fares, arrival_probs, bid_prices, n_simulations=5000, seed=1):
+    """Simulate a bid-price table, e.g. to check it against dp_booking_control's value.
+
+    Draws at most one request per period and night and accepts it iff its
+    fare reaches the bid price of the next seat.
+    """
+    rng = np.random.default_rng(seed)
+    fares = np.asarray(fares, dtype=float)
+    probs = np.atleast_2d(np.asarray(arrival_probs, dtype=float))
+    T, k = probs.shape
+    # Column k is "no request"; inverse-CDF draw of each period's class
+    cdf = np.cumsum(probs, axis=-1)
+    u = rng.random((T, n_simulations))
+
+    remaining = np.full(n_simulations, C, dtype=np.int64)
+    revenue = np.zeros(n_simulations)
+    sold = np.zeros((k, n_simulations), dtype=np.int64)
+    nights = np.arange(n_simulations)
+    for t in range(T):
+        request = (u[t, :, None] >= cdf[t]).sum(axis=-1)
+        has_seat = remaining > 0
+        fare = np.append(fares, 0.0)[request]
+        bid = bid_prices[t, np.maximum(remaining - 1, 0)]
+        accept = (request < k) & has_seat & (fare >= bid)
+        remaining -= accept
+        revenue += np.where(accept, fare, 0.0)
+        np.add.at(sold, (request[accept], nights[accept]), 1)
+
+    return {
+        "mean_revenue": revenue.mean(),
+        "std_revenue": revenue.std(),
+        "mean_sold": sold.mean(axis=-1),
+        "mean_load_factor": (C - remaining).mean() / C,
+    }
@@ -0,0 +1,90 @@
+"""Revenue curves behind the "Test this Q/Y" buttons of Slides 1.5 and 2.5."""
+
+import numpy as np
+
+from .variance import antithetic_normal, antithetic_uniform, variance_reduced_mean
+
+
+def simulate_protection_curve(
+    Q,
+    n_simulations=1000,
+    seed=1,
+    antithetic=False,
+    control_variates=False,
+    return_estimate=False,
+    summarize=True,
+):
+    """Mean revenue for every protection level in Q, same nights for each Q.
+
+    ``return_estimate=True`` returns variance_reduced_mean's estimate,
+    standard error and variance-reduction factor instead of the means;
+    ``summarize=False`` returns the per-night revenues, nights on the last axis.
+    """
+    rng = np.random.default_rng(seed)
+    C = 100
+    r_L, r_H = 80, 200
+    Q = np.asarray(Q)[:, None]
+
+    shape = (n_simulations, 2)
+    z = antithetic_normal(rng, shape) if antithetic else rng.standard_normal(shape)
+    demand = np.maximum([120, 50] + z * [15, 25], 0).astype(np.int64)
+    leisure_demand, business_demand = demand[:, 0], demand[:, 1]
+
+    # Leisure books first, limited by B = C - Q; business gets the rest
+    leisure_booked = np.minimum(leisure_demand, C - Q)
+    business_booked = np.minimum(business_demand, C - leisure_booked)
+    revenue = leisure_booked * r_L + business_booked * r_H
+    if not summarize:
+        return revenue
+    if not return_estimate:
+        return revenue.mean(axis=1)
+
+    # Controls: the raw demand draws, whose means are known exactly. They average
+    # to 0 within antithetic pairs, so paired nights use z² - 1 instead
+    controls = None
+    if control_variates:
+        controls = (z**2 - 1 if antithetic else z).T[:, None, :]
+    return variance_reduced_mean(revenue, controls, antithetic=antithetic)
+
+
+def simulate_overbooking_curve(
+    Y,
+    n_simulations=1000,
+    seed=1234,
+    antithetic=False,
+    control_variates=False,
+    return_estimate=False,
+    summarize=True,
+):
+    """Mean net revenue for every overbooking level in Y, same guests for each Y.
+
+    ``return_estimate=True`` returns variance_reduced_mean's estimate,
+    standard error and variance-reduction factor instead of the means;
+    ``summarize=False`` returns the per-night revenues, nights on the last axis.
+    """
+    rng = np.random.default_rng(seed)
+    C = 100
+    r = 150
+    c_bump = 400
+    noshow = 0.10
+    total_reservations = C + np.asarray(Y)[:, None]
+
+    # arrivals[i, n] = guests who turn up among the first n reservations
+    shape = (n_simulations, int(total_reservations.max()))
+    u = antithetic_uniform(rng, shape) if antithetic else rng.random(shape)
+    arrivals = np.concatenate(
+        [np.zeros((n_simulations, 1), dtype=np.int64), np.cumsum(u >= noshow, axis=1)], axis=1
+    )
+    arrivals = arrivals[np.arange(n_simulations), total_reservations]
+
+    occupied = np.minimum(arrivals, C)
+    bumped = np.maximum(arrivals - C, 0)
+    revenue = occupied * r - bumped * c_bump
+    if not summarize:
+        return revenue
+    if not return_estimate:
+        return revenue.mean(axis=1)
+
+    # Control: arrivals minus their known mean E[arrivals] = (C + Y)(1 - p)
+    controls = (arrivals - total_reservations * (1 - noshow))[None] if control_variates else None
+    return variance_reduced_mean(revenue, controls, antithetic=antithetic)
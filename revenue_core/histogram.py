@@ -0,0 +1,65 @@
+"""Histogram bins computed the way Vega-Lite's ``bin`` transform computes them.
+
+Charts can then ship one row per non-empty bin instead of every simulated
+night, and still draw the same bars as ``alt.X(..., bin=alt.Bin(...))``.
+"""
+
+import math
+
+import numpy as np
+
+# Vega's bin transform nudges (v - start) / step by this before flooring
+_EPSILON = 1e-14
+
+
+def vega_bin(extent, maxbins=10, step=None, base=10, divide=(5, 2), nice=True):
+    """Port of vega-statistics ``bin``: returns (start, stop, step) for a data extent."""
+    lo, hi = float(extent[0]), float(extent[1])
+    span = (hi - lo) or abs(lo) or 1
+    logb = math.log(base)
+
+    if step is None:
+        level = math.ceil(math.log(maxbins) / logb)
+        step = base ** (round(math.log(span) / logb) - level)
+        # Increase the step while there are too many bins, then refine it if allowed
+        while math.ceil(span / step) > maxbins:
+            step *= base
+        for d in divide:
+            if span / (step / d) <= maxbins:
+                step /= d
+
+    v = math.log(step)
+    precision = 0 if v >= 0 else int(-v / logb) + 1
+    eps = base ** (-precision - 1)
+    if nice:
+        v = math.floor(lo / step + eps) * step
+        lo = v - step if lo < v else v
+        hi = math.ceil(hi / step) * step
+    return lo, (lo + step if hi == lo else hi), step
+
+
+def histogram_bins(values, maxbins=10, step=None):
+    """Counts per non-empty bin, as a dict of columns ``bin_start``, ``bin_end``, ``count``.
+
+    Takes the same ``maxbins`` / ``step`` as ``alt.Bin``; the bin step used is
+    returned alongside so the chart axis can reuse it.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return {"bin_start": [], "bin_end": [], "count": [], "step": step or 1.0}
+
+    start, stop, step = vega_bin((values.min(), values.max()), maxbins=maxbins, step=step)
+    # Same assignment as Vega's bin transform: clamp into [start, stop - step], then floor
+    stop = start + math.ceil((stop - start) / step) * step
+    clamped = np.clip(values, start, stop - step)
+    index = np.floor(_EPSILON + (clamped - start) / step).astype(np.int64)
+    counts = np.bincount(index)
+    (nonempty,) = np.nonzero(counts)
+    bin_start = start + step * nonempty
+    return {
+        "bin_start": bin_start.tolist(),
+        "bin_end": (bin_start + step).tolist(),
+        "count": counts[nonempty].tolist(),
+        "step": step,
+    }
@@ -0,0 +1,91 @@
+"""Overbooking: the critical-fractile overbooking level and exact binomial outcomes."""
+
+import numpy as np
+
+
+def optimal_overbooking_level(C, r, c_bump, noshow_rate):
+    """Y* = floor(G^-1(r / (r + c_bump))) for no-shows G ~ Binomial(C, p), normal approximation.
+
+    Accept extra reservations while the no-show CDF stays at or below the
+    critical ratio (Cachon & Terwiesch).
+    """
+    from scipy import stats
+
+    crit_frac = r / (r + c_bump)
+    ns_mean = C * noshow_rate
+    ns_std = max(np.sqrt(C * noshow_rate * (1 - noshow_rate)), 1)
+    return max(0, int(np.floor(stats.norm.ppf(crit_frac, ns_mean, ns_std))))
+
+
+def compute_overbooking_curve(C, r, c_bump, noshow_rate, Y):
+    """Compute expected revenue and metrics for whole arrays of overbooking levels.
+
+    Arrivals follow the exact Binomial(C + Y, 1 - noshow_rate). All
+    arguments broadcast, so Y can be swept for many nights in one call.
+    """
+    from scipy import stats
+
+    C, r, c_bump, noshow_rate, Y = np.broadcast_arrays(
+        *(np.asarray(a) for a in (C, r, c_bump, noshow_rate, Y))
+    )
+
+    # Total reservations
+    total_reservations = C + Y
+
+    # Exact arrival distribution over a shared support 0..max(C + Y)
+    arrivals = np.arange(int(total_reservations.max(initial=0)) + 1)
+    probs = stats.binom.pmf(
+        arrivals, total_reservations[..., None], 1 - noshow_rate[..., None]
+    )
+    capacity = C[..., None]
+
+    # Bumped = max(0, arrivals - C), empty = max(0, C - arrivals)
+    expected_bumped = (probs * np.maximum(arrivals - capacity, 0)).sum(axis=-1)
+    expected_empty = (probs * np.maximum(capacity - arrivals, 0)).sum(axis=-1)
+    prob_bumping = (probs * (arrivals > capacity)).sum(axis=-1)
+
+    # Occupied = arrivals - bumped, so E[min(A, C)] follows from E[A]
+    expected_arrivals = total_reservations * (1 - noshow_rate)
+    expected_occupied = expected_arrivals - expected_bumped
+    expected_net_revenue = expected_occupied * r - expected_bumped * c_bump
+
+    return {
+        "total_reservations": total_reservations,
+        "expected_arrivals": expected_arrivals,
+        "expected_occupied": expected_occupied,
+        "expected_empty": expected_empty,
+        "expected_bumped": expected_bumped,
+        "prob_bumping": prob_bumping,
+        "expected_net_revenue": expected_net_revenue,
+    }
+
+
+def compute_overbooking_metrics(C, r, c_bump, noshow_rate, Y):
+    """Compute expected revenue and metrics for given overbooking level."""
+    curve = compute_overbooking_curve(C, r, c_bump, noshow_rate, Y)
+    return {k: v.item() for k, v in curve.items()}
+
+
+def simulate_exact_booking(n_simulations=1000, seed=2, sampler=None):
+    """Simulate outcomes when booking exactly 100 rooms, one array entry per night."""
+    rng = np.random.default_rng(seed)
+    C = 100  # capacity
+    noshow_rate = 0.10
+    r = 150  # room rate
+
+    # Each guest has 10% chance of not showing
+    if sampler is None:
+        noshows = rng.binomial(C, noshow_rate, size=n_simulations)
+    else:
+        from scipy import stats
+
+        noshows = stats.binom.ppf(sampler.random(n_simulations, 1)[:, 0], C, noshow_rate)
+        noshows = noshows.astype(np.int64)
+    arrivals = C - noshows
+    empty_rooms = noshows
+    return {
+        "Arrivals": arrivals,
+        "Empty Rooms": empty_rooms,
+        "Lost Revenue": empty_rooms * r,
+        "Actual Revenue": arrivals * r,
+    }
@@ -0,0 +1,169 @@
+"""Build-time bundle of the notebook's seed-fixed results for the html-wasm export.
+
+    python -m revenue_core.precompute            # writes public/data/precomputed_v1.json
+
+Every call in NOTEBOOK_CALLS is deterministic, so it can run once in CI
+instead of in every visitor's browser. The bundle is JSON with NumPy arrays
+stored as zlib-compressed base64. It records a fingerprint of the
+revenue_core sources and is ignored once the models change.
+"""
+
+import argparse
+import base64
+import hashlib
+import inspect
+import json
+import os
+import time
+import warnings
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from .booking import simulate_fcfs
+from .combined import run_policy_comparison
+from .exploration import simulate_overbooking_curve, simulate_protection_curve
+from .overbooking import simulate_exact_booking
+from .sensitivity import sensitivity_cube
+
+BUNDLE_PATH = os.path.join("public", "data", "precomputed_v1.json")
+BUNDLE_VERSION = 1
+
+# Calls revenue.py makes on load, must match the arguments used there
+NOTEBOOK_CALLS = (
+    (simulate_fcfs, {"n_simulations": 1000}),
+    (simulate_exact_booking, {"n_simulations": 10000}),
+    (
+        run_policy_comparison,
+        {"C": 100, "r_L": 80, "r_H": 200, "c_bump": 400, "mean_H": 50, "std_H": 15, "noshow_rate": 0.10},
+    ),
+    (sensitivity_cube, {}),
+    (simulate_protection_curve, {"Q": list(range(0, 101))}),
+    (simulate_overbooking_curve, {"Y": list(range(0, 31))}),
+)
+
+
+def source_fingerprint():
+    """SHA-256 over the revenue_core sources, so a bundle never outlives the models."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _call_key(fn, args, kwargs):
+    # Normalize positional/keyword/default spellings of the same call
+    fn = inspect.unwrap(fn)
+    bound = inspect.signature(fn).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return json.dumps([fn.__name__, sorted(bound.arguments.items())])
+
+
+def _encode(value):
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return {
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+            "zlib": base64.b64encode(zlib.compress(value.tobytes(), 9)).decode("ascii"),
+        }
+    if isinstance(value, (list, tuple)):
+        return [v.item() if isinstance(v, np.generic) else v for v in value]
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict) and "zlib" in value:
+        data = zlib.decompress(base64.b64decode(value["zlib"]))
+        return np.frombuffer(data, dtype=value["dtype"]).reshape(value["shape"]).copy()
+    if isinstance(value, dict):
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
+class PrecomputedBundle:
+    """Results loaded from a bundle, looked up by function and call arguments.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, entries=None):
+        self.hits = 0
+        self.misses = 0
+        self._entries = entries or {}
+
+    def get(self, fn, *args, **kwargs):
+        """The bundled result of fn(*args, **kwargs), or None."""
+        try:
+            key = _call_key(fn, args, kwargs)
+        except TypeError:
+            # Arguments that do not serialize (e.g. samplers) are never bundled
+            key = None
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def run(self, fn, *args, **kwargs):
+        """The bundled result if there is one, else the result of calling fn."""
+        result = self.get(fn, *args, **kwargs)
+        return fn(*args, **kwargs) if result is None else result
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def build_bundle(calls=NOTEBOOK_CALLS):
+    """Run every call and return the bundle as a JSON-ready dict."""
+    entries = []
+    for fn, kwargs in calls:
+        start = time.perf_counter()
+        result = fn(**kwargs)
+        entries.append(
+            {
+                "key": _call_key(fn, (), kwargs),
+                "seconds": time.perf_counter() - start,
+                "result": _encode(result),
+            }
+        )
+    return {"version": BUNDLE_VERSION, "fingerprint": source_fingerprint(), "entries": entries}
+
+
+def load_bundle(data):
+    """Parse bundle bytes or text; empty when missing, from another version or stale.
+
+    A bundle that is present but unusable raises a one-line warning, since
+    every call it held is then simulated again.
+    """
+    if not data:
+        return PrecomputedBundle()
+    bundle = json.loads(data)
+    if bundle.get("version") != BUNDLE_VERSION or bundle.get("fingerprint") != source_fingerprint():
+        warnings.warn(
+            "Ignoring a stale precomputed bundle (built from other revenue_core sources), "
+            "rerun python -m revenue_core.precompute",
+            stacklevel=2,
+        )
+        return PrecomputedBundle()
+    return PrecomputedBundle({e["key"]: _decode(e["result"]) for e in bundle["entries"]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, default=Path(BUNDLE_PATH))
+    args = parser.parse_args()
+
+    bundle = build_bundle()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(bundle, separators=(",", ":")))
+    for entry in bundle["entries"]:
+        print(f"  {json.loads(entry['key'])[0]:<28} {entry['seconds'] * 1000:9.1f} ms")
+    print(f"Wrote {args.output} ({args.output.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
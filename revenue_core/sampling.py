@@ -0,0 +1,46 @@
+"""Sampling backends: pseudo-random or scrambled quasi-Monte Carlo uniforms."""
+
+import numpy as np
+
+
+class UniformSampler:
+    """Source of uniforms on (0, 1)^d for inverse-CDF demand and no-show draws.
+
+    ``kind`` is "pseudo" (NumPy Generator), "sobol" or "halton"
+    (scipy.stats.qmc). Every call to ``random`` starts a fresh, independently
+    scrambled point set; Sobol sets are best used with powers of two.
+    """
+
+    def __init__(self, kind="pseudo", seed=1, scramble=True):
+        if kind not in ("pseudo", "sobol", "halton"):
+            raise ValueError(f"Unknown sampler kind: {kind!r}")
+        self.kind = kind
+        self.scramble = scramble
+        self._rng = np.random.default_rng(seed)
+
+    def random(self, n, d):
+        from scipy import stats
+
+        if self.kind == "pseudo":
+            u = self._rng.random((n, d))
+        elif self.kind == "sobol":
+            u = stats.qmc.Sobol(d, scramble=self.scramble, rng=self._rng).random(n)
+        else:
+            u = stats.qmc.Halton(d, scramble=self.scramble, rng=self._rng).random(n)
+        # Keep inverse CDFs finite at the (unscrambled) corner points
+        return np.clip(u, 1e-12, 1 - 1e-12)
+
+
+def randomized_qmc(estimate, kind="sobol", n_replicates=8, seed=1):
+    """Run ``estimate(sampler)`` on independently scrambled point sets.
+
+    The spread of the replicate estimates gives the standard error that a
+    single QMC point set cannot provide.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+    replicates = np.array([estimate(UniformSampler(kind, seed=s)) for s in seeds])
+    return {
+        "mean": replicates.mean(axis=0),
+        "std_error": replicates.std(axis=0, ddof=1) / np.sqrt(n_replicates),
+        "replicates": replicates,
+    }
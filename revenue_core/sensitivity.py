@@ -0,0 +1,50 @@
+"""Policy comparison over the grid of the Slide 3.5 sensitivity sliders."""
+
+import numpy as np
+
+from .combined import run_policy_comparison
+
+# Slider grids, must match the Slide 3.5 sliders (12 x 8 x 16 states)
+SENSITIVITY_GRID = {
+    "noshow_rate": np.round(np.linspace(0.02, 0.24, 12), 2),
+    "fare_ratio": np.linspace(1.5, 5.0, 8),
+    "bump_ratio": np.linspace(0.5, 8.0, 16),
+}
+
+
+def sensitivity_cube(C=100, r_L=80, mean_H=50, std_H=15):
+    """Evaluate the four policies for every slider state.
+
+    Returns a dict of columns, one row per state in row-major grid order
+    (noshow_rate, then fare_ratio, then bump_ratio).
+    """
+    # Bypass the simulation cache, the cube would only evict useful entries
+    compare = run_policy_comparison.__wrapped__
+    rows = []
+    for noshow_rate in SENSITIVITY_GRID["noshow_rate"]:
+        for fare_ratio in SENSITIVITY_GRID["fare_ratio"]:
+            for bump_ratio in SENSITIVITY_GRID["bump_ratio"]:
+                r_H, c_bump = r_L * fare_ratio, r_L * bump_ratio
+                comparison = compare(C, r_L, r_H, c_bump, mean_H, std_H, noshow_rate)
+                revenue = comparison["Revenue"]
+                rows.append(
+                    (
+                        noshow_rate,
+                        fare_ratio,
+                        bump_ratio,
+                        r_H,
+                        c_bump,
+                        comparison["Q"][3],
+                        comparison["Y"][3],
+                        *revenue,
+                    )
+                )
+    names = (
+        "noshow_rate", "fare_ratio", "bump_ratio", "r_H", "c_bump", "Q_star", "Y_star",
+        "revenue_fcfs", "revenue_booking_limits", "revenue_overbooking", "revenue_combined",
+    )
+    columns = dict(zip(names, zip(*rows)))
+    return {
+        name: np.asarray(values, dtype=np.int64 if name in ("Q_star", "Y_star") else float)
+        for name, values in columns.items()
+    }
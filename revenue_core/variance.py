@@ -0,0 +1,65 @@
+"""Variance reduction: antithetic pairs and regression control variates."""
+
+import numpy as np
+
+
+def antithetic_normal(rng, size):
+    """Standard normals in antithetic pairs: night 2k + 1 mirrors night 2k."""
+    size = (size,) if np.isscalar(size) else tuple(size)
+    if size[0] % 2:
+        raise ValueError("antithetic sampling needs an even number of nights")
+    half = rng.standard_normal((size[0] // 2,) + size[1:])
+    return np.stack([half, -half], axis=1).reshape(size)
+
+
+def antithetic_uniform(rng, size):
+    """Uniforms in antithetic pairs: night 2k + 1 uses 1 - U of night 2k."""
+    size = (size,) if np.isscalar(size) else tuple(size)
+    if size[0] % 2:
+        raise ValueError("antithetic sampling needs an even number of nights")
+    half = rng.random((size[0] // 2,) + size[1:])
+    return np.stack([half, 1 - half], axis=1).reshape(size)
+
+
+def variance_reduced_mean(y, controls=None, antithetic=False):
+    """Estimate E[y] from nights on the last axis of ``y``.
+
+    With ``antithetic=True`` consecutive nights are averaged as pairs.
+    ``controls`` stacks zero-mean control variates on a new first axis, shape
+    (k, ..., n); their regression coefficients are fitted per leading cell.
+    Returns the estimate, its standard error and the variance-reduction factor
+    versus plain averaging of the same nights (inf when the controls leave no
+    variance, nan when y is constant).
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.shape[-1]
+    plain_var = y.var(axis=-1, ddof=1) / n
+    if antithetic:
+        y = (y[..., 0::2] + y[..., 1::2]) / 2
+        if controls is not None:
+            controls = (controls[..., 0::2] + controls[..., 1::2]) / 2
+
+    ddof = 1
+    if controls is not None:
+        X = np.broadcast_to(controls, (len(controls),) + y.shape).astype(float)
+        Xc = X - X.mean(axis=-1, keepdims=True)
+        yc = y - y.mean(axis=-1, keepdims=True)
+        # beta solves Cov(X) beta = Cov(X, y); pinv copes with degenerate controls
+        Sxx = np.einsum("i...n,j...n->...ij", Xc, Xc)
+        Sxy = np.einsum("i...n,...n->...i", Xc, yc)
+        beta = (np.linalg.pinv(Sxx) @ Sxy[..., None])[..., 0]
+        y = y - np.einsum("...i,i...n->...n", beta, X)
+        ddof += len(controls)
+
+    m = y.shape[-1]
+    var = y.var(axis=-1, ddof=ddof) / m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reduction = plain_var / var
+    # Controls that explain y exactly leave only rounding noise: report inf, not 1e29
+    reduction = np.where(var <= np.finfo(float).eps * plain_var, np.inf, reduction)
+    reduction = np.where(plain_var > 0, reduction, np.nan)
+    return {
+        "mean": y.mean(axis=-1),
+        "std_error": np.sqrt(var),
+        "variance_reduction": reduction,
+    }